@@ -57,11 +57,9 @@ class DrillPointExtractor:
                 entity_count += 1
 
                 # Is this a potential drilling entity?
-                is_potential_drill = (
-                    hasattr(entity, "dxftype")
-                    and hasattr(entity.dxf, "layer")
-                    and ("DRILL" in entity.dxf.layer or "DRILLING" in entity.dxf.layer)
-                )
+                # Modelspace only holds graphic entities, which always have a layer
+                layer = entity.dxf.layer
+                is_potential_drill = "DRILL" in layer or "DRILLING" in layer
 
                 # Extract drill point data if applicable
                 drill_data = self._extract_from_entity(entity)
@@ -89,7 +87,7 @@ class DrillPointExtractor:
                     issues.append(
                         {
                             "entity_type": entity.dxftype(),
-                            "layer": entity.dxf.layer,
+                            "layer": layer,
                             "position": position,
                         }
                     )
@@ -445,28 +443,28 @@ class WorkpieceExtractor:
         Returns:
             dict or None: Workpiece data if found, None otherwise
         """
-        # Look for all polylines
-        outline_t_polylines = []  # Priority: OUTLINE_T* layers
-        other_polylines = []  # Fallback: other workpiece layers
+        # Look for polylines on workpiece layers
+        workpiece_polyline = None  # Priority: first OUTLINE_T* polyline
+        fallback_polyline = None  # Fallback: first other workpiece polyline
 
         # Try first for new-style LWPOLYLINE
+        # Polylines are graphic entities, so they always have a layer attribute
         for entity in modelspace:
             if entity.dxftype() in ["LWPOLYLINE", "POLYLINE"]:
-                if hasattr(entity.dxf, "layer"):
-                    layer = entity.dxf.layer
-                    # Prioritize OUTLINE_T* layers over others
-                    if "OUTLINE_T" in layer:
-                        outline_t_polylines.append(entity)
-                    # Other workpiece layers as fallback
-                    elif "PANEL_" in layer or "OUTLINE_" in layer:
-                        other_polylines.append(entity)
+                layer = entity.dxf.layer
+                # OUTLINE_T* has top priority, so stop scanning once one is found
+                if "OUTLINE_T" in layer:
+                    workpiece_polyline = entity
+                    break
+                # Other workpiece layers as fallback
+                if fallback_polyline is None and ("PANEL_" in layer or "OUTLINE_" in layer):
+                    fallback_polyline = entity
 
         # Prioritize OUTLINE_T* polylines if found
-        if outline_t_polylines:
-            workpiece_polyline = outline_t_polylines[0]
+        if workpiece_polyline is not None:
             self.logger.info(f"Using prioritized OUTLINE_T* layer: {workpiece_polyline.dxf.layer}")
-        elif other_polylines:
-            workpiece_polyline = other_polylines[0]
+        elif fallback_polyline is not None:
+            workpiece_polyline = fallback_polyline
             self.logger.info(f"Using fallback layer: {workpiece_polyline.dxf.layer}")
         else:
             self.logger.warning("No workpiece polylines found on PANEL_* or OUTLINE_* layers")
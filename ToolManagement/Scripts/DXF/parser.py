@@ -8,6 +8,7 @@ and parsing them into structured document objects using ezdxf library.
 import glob
 import os
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -83,15 +84,10 @@ class DXFParser(BaseFileLoader):
         try:
             # Extract basic information
             modelspace = dxf_doc.modelspace()
-            entity_count = len(list(modelspace))
+            entity_count = len(modelspace)
 
             # Count entity types
-            entity_types = {}
-            for entity in modelspace:
-                entity_type = entity.dxftype()
-                if entity_type not in entity_types:
-                    entity_types[entity_type] = 0
-                entity_types[entity_type] += 1
+            entity_types = dict(Counter(entity.dxftype() for entity in modelspace))
 
             # Get layers
             layers = [layer.dxf.name for layer in dxf_doc.layers]
@@ -144,7 +140,7 @@ class DXFParser(BaseFileLoader):
 
             # Check if modelspace contains at least one entity
             modelspace = self.dxf_doc.modelspace()
-            entity_count = len(list(modelspace))
+            entity_count = len(modelspace)
 
             if entity_count == 0:
                 self.logger.error("DXF file contains no entities in modelspace")
@@ -271,12 +267,7 @@ if __name__ == "__main__":
             # Show additional info for successful parse
             print("\nEntity types:")
             modelspace = result["document"].modelspace()
-            entity_types = {}
-            for entity in modelspace:
-                entity_type = entity.dxftype()
-                if entity_type not in entity_types:
-                    entity_types[entity_type] = 0
-                entity_types[entity_type] += 1
+            entity_types = Counter(entity.dxftype() for entity in modelspace)
 
             for entity_type, count in entity_types.items():
                 print(f"  - {entity_type}: {count}")
@@ -16,6 +16,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from Utils.error_utils import ErrorHandler, ErrorSeverity, ValidationError
 from Utils.logging_utils import setup_logger
 
+# Fields every drill point needs before it can be translated
+REQUIRED_DRILL_POINT_FIELDS = frozenset(("position", "diameter", "depth", "extrusion_vector"))
+
 
 class VisualCoordinateTranslator:
     """
@@ -74,9 +77,12 @@ class VisualCoordinateTranslator:
                 original_coords = point["position"]
                 extrusion_vector = point["extrusion_vector"]
 
-                # Detect drilling direction
+                # Detect drilling direction (the directions are exclusive, so
+                # only check Y when the point is not X-direction)
                 is_x_direction = self._is_x_direction_drilling(extrusion_vector)
-                is_y_direction = self._is_y_direction_drilling(extrusion_vector)
+                is_y_direction = not is_x_direction and self._is_y_direction_drilling(
+                    extrusion_vector
+                )
 
                 # Skip if not a horizontal drilling operation
                 if not (is_x_direction or is_y_direction):
@@ -183,8 +189,7 @@ class VisualCoordinateTranslator:
             bool: True if valid, False otherwise
         """
         # Check required fields exist
-        required_fields = ["position", "diameter", "depth", "extrusion_vector"]
-        if not all(field in point for field in required_fields):
+        if not REQUIRED_DRILL_POINT_FIELDS.issubset(point):
             self.logger.warning(f"Drill point missing required fields: {point}")
             return False
 
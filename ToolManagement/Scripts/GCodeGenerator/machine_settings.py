@@ -9,7 +9,7 @@ import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 # Add parent directory to Python path for imports
 parent_dir = Path(__file__).parent.parent
@@ -29,6 +29,27 @@ class MachineSettings:
     G-code, with a focus on horizontal drilling operations.
     """
 
+    # Map vectors to axis information with minimal descriptions
+    VECTOR_AXIS_INFO: ClassVar[dict[tuple[float, float, float], dict[str, Any]]] = {
+        (1.0, 0.0, 0.0): {"axis": "X", "direction": 1, "description": "X+"},
+        (-1.0, 0.0, 0.0): {"axis": "X", "direction": -1, "description": "X-"},
+        (0.0, 1.0, 0.0): {"axis": "Y", "direction": 1, "description": "Y+"},
+        (0.0, -1.0, 0.0): {"axis": "Y", "direction": -1, "description": "Y-"},
+    }
+
+    # Map operation types to their feed rate setting keys
+    FEED_RATE_KEYS: ClassVar[dict[str, str]] = {
+        "drilling": "drilling_feed_rate",
+        "rapid": "rapid_feed_rate",
+        "retraction": "retraction_feed_rate",
+    }
+
+    # Map of positioning commands to M-codes
+    POSITIONING_COMMANDS: ClassVar[dict[str, str]] = {
+        "safe_z_positioning": "M151",  # Safe Z height positioning
+        "tooltip_positioning": "M152",  # Tooltip Z positioning
+    }
+
     def __init__(self, custom_settings: dict[str, Any] | None = None):
         """
         Initialize machine settings.
@@ -69,6 +90,10 @@ class MachineSettings:
         # Load tool change height from m6start macro
         self._tool_change_height = self._read_tool_change_height_from_macro()
 
+        # Bound coordinate formatter for the current decimal precision
+        self._coordinate_precision = None
+        self._coordinate_format = None
+
         self.logger.info("MachineSettings initialized")
 
     def get_feed_rate(self, operation_type: str) -> float:
@@ -81,12 +106,9 @@ class MachineSettings:
         Returns:
             float: Feed rate in mm/min
         """
-        if operation_type == "drilling":
-            return self.settings["drilling_feed_rate"]
-        if operation_type == "rapid":
-            return self.settings["rapid_feed_rate"]
-        if operation_type == "retraction":
-            return self.settings["retraction_feed_rate"]
+        setting_key = self.FEED_RATE_KEYS.get(operation_type)
+        if setting_key is not None:
+            return self.settings[setting_key]
         # Default to drilling feed rate if unknown
         self.logger.warning(f"Unknown operation type: {operation_type}, using drilling feed rate")
         return self.settings["drilling_feed_rate"]
@@ -150,7 +172,7 @@ class MachineSettings:
             None: If value cannot be read (triggers safety error)
         """
         # Try multiple possible macro paths
-        mach3_root = AppConfig.paths.DEFAULT_MACH3_ROOT
+        mach3_root = AppConfig.paths.get_mach3_root()
         macro_paths = [
             mach3_root / "macros" / "Mach3Development" / "m6Start.m1s",
             mach3_root / "macros" / "Mach3Mill" / "m6start.m1s",
@@ -187,14 +209,9 @@ class MachineSettings:
         Returns:
             dict: Dictionary with positioning command keys and M-codes
         """
-        # Map of positioning commands to M-codes
-        commands = {
-            "safe_z_positioning": "M151",  # Safe Z height positioning
-            "tooltip_positioning": "M152",  # Tooltip Z positioning
-        }
-
+        # Return a copy so callers cannot change the shared mapping
         self.logger.info("Retrieved horizontal drill positioning commands")
-        return commands
+        return self.POSITIONING_COMMANDS.copy()
 
     def get_vector_axis_info(self, direction_vector: tuple[float, float, float]) -> dict[str, Any]:
         """
@@ -206,17 +223,10 @@ class MachineSettings:
         Returns:
             dict: Axis information with keys 'axis', 'direction', 'description'
         """
-        # Map vectors to axis information with minimal descriptions
-        vector_map = {
-            (1.0, 0.0, 0.0): {"axis": "X", "direction": 1, "description": "X+"},
-            (-1.0, 0.0, 0.0): {"axis": "X", "direction": -1, "description": "X-"},
-            (0.0, 1.0, 0.0): {"axis": "Y", "direction": 1, "description": "Y+"},
-            (0.0, -1.0, 0.0): {"axis": "Y", "direction": -1, "description": "Y-"},
-        }
-
-        # Return the mapped info or a default if not found
-        if direction_vector in vector_map:
-            return vector_map[direction_vector]
+        # Return a copy of the mapped info or a default if not found
+        axis_info = self.VECTOR_AXIS_INFO.get(direction_vector)
+        if axis_info is not None:
+            return axis_info.copy()
         self.logger.warning(f"Unsupported direction vector: {direction_vector}")
         return {"axis": "?", "direction": 0, "description": "Unknown"}
 
@@ -262,9 +272,13 @@ class MachineSettings:
         Returns:
             str: Formatted coordinate string
         """
-        # Format with the specified decimal precision
-        format_str = f"{{:.{self.settings['decimal_precision']}f}}"
-        return format_str.format(value)
+        # Rebuild the formatter only when the decimal precision setting changes
+        precision = self.settings["decimal_precision"]
+        if precision != self._coordinate_precision:
+            self._coordinate_precision = precision
+            self._coordinate_format = f"{{:.{precision}f}}".format
+
+        return self._coordinate_format(value)
 
     def format_comment(self, comment: str) -> str:
         """
@@ -6,8 +6,9 @@ tools in the tool database, ensuring exact diameter matches for drills.
 """
 
 import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 # Add parent directory to Python path for imports
 parent_dir = Path(__file__).parent.parent
@@ -29,6 +30,13 @@ class ToolMatcher:
     for drilling operations based on diameter and direction.
     """
 
+    # Optional tool data fields converted to float in match results
+    NUMERIC_FIELDS: ClassVar[tuple[str, ...]] = (
+        "tool_length",
+        "max_working_length",
+        "tool_holder_z_offset",
+    )
+
     def __init__(self, tool_data_path: str | None = None):
         """
         Initialize the tool matcher.
@@ -43,6 +51,9 @@ class ToolMatcher:
         # Use provided tool data path or get from config
         self.tool_data_path = tool_data_path or str(AppConfig.paths.get_tool_data_path())
 
+        # Tool index from the last successful read as (file modification time, index)
+        self._tool_index_cache: tuple[int, dict] | None = None
+
         self.logger.info(f"ToolMatcher initialized with tool data: {self.tool_data_path}")
 
     def match_tool_to_group(
@@ -123,6 +134,63 @@ class ToolMatcher:
         # Use mapping directly from config
         return AppConfig.tool.DIRECTION_VECTOR_MAPPING.get(vector)
 
+    def _build_tool_index(
+        self, rows: list[dict[str, Any]]
+    ) -> dict[tuple[float, int], list[tuple[int, dict[str, Any]]]]:
+        """
+        Index tool rows by diameter (rounded to 0.01mm) and direction code.
+
+        Args:
+            rows: Tool rows from the tool data CSV
+
+        Returns:
+            dict: Maps (diameter, direction_code) to a list of (row position, row)
+        """
+        index = {}
+        for position, row in enumerate(rows):
+            try:
+                # Skip if missing required fields
+                if not all(key in row for key in ["tool_number", "diameter", "tool_direction"]):
+                    continue
+
+                # Convert numeric fields
+                key = (round(float(row["diameter"]), 2), int(row["tool_direction"]))
+            except (ValueError, KeyError, TypeError):
+                # Skip rows with invalid data
+                continue
+
+            index.setdefault(key, []).append((position, row))
+
+        return index
+
+    def _load_tool_index(self) -> tuple[bool, str, dict]:
+        """
+        Load the tool index, reusing the last one while the CSV file is unchanged.
+
+        Returns:
+            tuple: (success, message, index) where message and index hold the
+                read_csv error details on failure
+        """
+        try:
+            mtime_ns = Path(self.tool_data_path).stat().st_mtime_ns
+        except OSError:
+            # Let read_csv report the missing or unreadable file
+            mtime_ns = None
+
+        # Reuse the cached index if the file has not been modified since
+        if self._tool_index_cache is not None and self._tool_index_cache[0] == mtime_ns:
+            return True, "Tool index reused from previous read", self._tool_index_cache[1]
+
+        success, message, data = FileUtils.read_csv(self.tool_data_path)
+        if not success:
+            return success, message, data
+
+        index = self._build_tool_index(data.get("rows", []))
+        if mtime_ns is not None:
+            self._tool_index_cache = (mtime_ns, index)
+
+        return True, message, index
+
     def _search_for_matching_tool(
         self, diameter: float, direction_code: int
     ) -> tuple[bool, str, dict[str, Any]]:
@@ -136,8 +204,8 @@ class ToolMatcher:
         Returns:
             tuple: (success, message, details) with matching tool
         """
-        # Read the tool data CSV
-        success, message, data = FileUtils.read_csv(self.tool_data_path)
+        # Load the tool index from the tool data CSV
+        success, message, index = self._load_tool_index()
         if not success:
             return ErrorHandler.from_exception(
                 ValidationError(
@@ -145,24 +213,18 @@ class ToolMatcher:
                 )
             )
 
-        # Find tools matching criteria
-        matching_tools = []
-        for row in data.get("rows", []):
-            try:
-                # Skip if missing required fields
-                if not all(key in row for key in ["tool_number", "diameter", "tool_direction"]):
-                    continue
-
-                # Convert numeric fields
-                row_diameter = float(row["diameter"])
-                row_direction = int(row["tool_direction"])
-
-                # Check for exact diameter and matching direction
-                if abs(row_diameter - diameter) < 0.01 and row_direction == direction_code:
-                    matching_tools.append(row)
-            except (ValueError, KeyError, TypeError):
-                # Skip rows with invalid data
-                continue
+        # A diameter within 0.01mm can round into a neighbouring bucket, so check
+        # those too and keep the tools in CSV order
+        rounded_diameter = round(diameter, 2)
+        candidates = []
+        for offset in (-0.01, 0.0, 0.01):
+            bucket_key = (round(rounded_diameter + offset, 2), direction_code)
+            candidates.extend(
+                (position, row)
+                for position, row in index.get(bucket_key, [])
+                if abs(float(row["diameter"]) - diameter) < 0.01
+            )
+        matching_tools = [row for _, row in sorted(candidates, key=itemgetter(0))]
 
         # Return error if no matches found
         if not matching_tools:
@@ -197,9 +259,7 @@ class ToolMatcher:
         }
 
         # Convert numeric fields if present
-        numeric_fields = ["tool_length", "max_working_length", "tool_holder_z_offset"]
-
-        for field in numeric_fields:
+        for field in self.NUMERIC_FIELDS:
             if tool.get(field):
                 try:
                     formatted_tool[field] = float(tool[field])
@@ -82,17 +82,8 @@ class MachinePositioner:
             # Calculate offset based on point C's position
             offset_x, offset_y = self._determine_offset(x_c, y_c)
 
-            # Apply offset to corner points
-            machine_corner_points = []
-            for corner in corner_points:
-                machine_corner = self._apply_offset_to_coordinates(corner, (offset_x, offset_y))
-                machine_corner_points.append(machine_corner)
-
-            # Apply offset to drill points
-            machine_drill_points = []
-
+            # Validate all drill points before transforming any of them
             for point in drill_points:
-                # Validate drill point has position
                 if "position" not in point:
                     return ErrorHandler.from_exception(
                         ValidationError(
@@ -101,18 +92,22 @@ class MachinePositioner:
                         )
                     )
 
-                # Create a copy of the point
-                machine_point = point.copy()
-
-                # Store original position
-                machine_point["original_position"] = point["position"]
-
-                # Apply offset to position
-                machine_point["machine_position"] = self._apply_offset_to_coordinates(
-                    point["position"], (offset_x, offset_y)
-                )
+            # Apply offset to corner points and drill point positions as batches
+            offset = (offset_x, offset_y)
+            machine_corner_points = self._apply_offset_to_batch(corner_points, offset)
+            machine_positions = self._apply_offset_to_batch(
+                [point["position"] for point in drill_points], offset
+            )
 
-                machine_drill_points.append(machine_point)
+            # Copy each drill point, keeping its original position alongside the machine one
+            machine_drill_points = [
+                {
+                    **point,
+                    "original_position": point["position"],
+                    "machine_position": machine_position,
+                }
+                for point, machine_position in zip(drill_points, machine_positions, strict=True)
+            ]
 
             # Create updated workpiece with machine coordinates
             positioned_workpiece = workpiece.copy()
@@ -227,6 +222,24 @@ class MachinePositioner:
 
         return (new_x, new_y, z)
 
+    def _apply_offset_to_batch(
+        self, coordinates_list: list[tuple[float, float, float]], offset: tuple[float, float]
+    ) -> list[tuple[float, float, float]]:
+        """
+        Apply the same offset to a batch of 3D coordinates.
+
+        Args:
+            coordinates_list: List of (x, y, z) coordinates to offset
+            offset: (offset_x, offset_y) to apply
+
+        Returns:
+            List of (new_x, new_y, z) with offset applied
+        """
+        return [
+            self._apply_offset_to_coordinates(coordinates, offset)
+            for coordinates in coordinates_list
+        ]
+
     def get_orientation_name(self, point_c: tuple[float, float, float]) -> str:
         """
         Get the orientation name based on point C's position.
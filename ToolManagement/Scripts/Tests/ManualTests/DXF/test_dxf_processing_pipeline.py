@@ -8,10 +8,13 @@ This script tests the complete processing pipeline for the DXF package:
 3. Translate visual coordinates using VisualCoordinateTranslator
 
 Usage:
-    python test_dxf_processing_pipeline.py
+    python test_dxf_processing_pipeline.py [--verbose]
+
+    --verbose  Also dump the full structure of every extracted and translated point
 """
 
 import sys
+import traceback
 from pathlib import Path
 
 # Add parent directory to Python path for proper imports
@@ -29,8 +32,20 @@ from DXF.visual_coordinate_translator import VisualCoordinateTranslator
 from Utils.ui_utils import UIUtils
 
 
-def process_dxf_file(dxf_file_path):
-    """Process a DXF file through the complete pipeline."""
+def format_point(point) -> str:
+    """Format an (x, y, z) point with one decimal place, unpacking it once."""
+    x, y, z = point
+    return f"({x:.1f}, {y:.1f}, {z:.1f})"
+
+
+def process_dxf_file(dxf_file_path, verbose: bool = False):
+    """
+    Process a DXF file through the complete pipeline.
+
+    Args:
+        dxf_file_path: Path to the DXF file to process
+        verbose: Whether to dump the full key/value structure of every result
+    """
     UIUtils.print_separator(f"Processing DXF File: {Path(dxf_file_path).name}")
 
     # STEP 1: Parse DXF file
@@ -69,19 +84,20 @@ def process_dxf_file(dxf_file_path):
 
     print("\nCorner Points:")
     for i, point in enumerate(workpiece["corner_points"]):
-        print(f"  Point {i}: ({point[0]:.1f}, {point[1]:.1f}, {point[2]:.1f})")
+        print(f"  Point {i}: {format_point(point)}")
 
     # Display ALL available keys in workpiece
-    print("\nAll workpiece keys:")
-    for key in sorted(workpiece.keys()):
-        print(f"  - {key}: {type(workpiece[key]).__name__}")
+    if verbose:
+        print("\nAll workpiece keys:")
+        for key in sorted(workpiece.keys()):
+            print(f"  - {key}: {type(workpiece[key]).__name__}")
 
     # Display ALL drill points with FULL details
     drill_points = extract_result["drill_points"]
     print(f"\nDRILL POINTS: {len(drill_points)} total")
     print("-" * 80)
 
-    if drill_points:
+    if verbose and drill_points:
         # Show keys in first drill point
         first_point = drill_points[0]
         print("Drill point structure (keys in first point):")
@@ -107,14 +123,15 @@ def process_dxf_file(dxf_file_path):
                 print(f"    {key}: {value}")
 
     # Display all keys in extraction result
-    print("\nExtraction result keys:")
-    for key in sorted(extract_result.keys()):
-        value_type = type(extract_result[key]).__name__
-        if isinstance(extract_result[key], list):
-            value_info = f"{value_type} of length {len(extract_result[key])}"
-        else:
-            value_info = value_type
-        print(f"  - {key}: {value_info}")
+    if verbose:
+        print("\nExtraction result keys:")
+        for key in sorted(extract_result.keys()):
+            value_type = type(extract_result[key]).__name__
+            if isinstance(extract_result[key], list):
+                value_info = f"{value_type} of length {len(extract_result[key])}"
+            else:
+                value_info = value_type
+            print(f"  - {key}: {value_info}")
 
     # STEP 3: Translate visual coordinates to physical space
     UIUtils.print_separator("Step 3: Translate Coordinates")
@@ -130,19 +147,20 @@ def process_dxf_file(dxf_file_path):
     print(f"SUCCESS: {translate_message}")
 
     # Display ALL keys in translation result
-    print("\nTranslation result keys:")
-    for key in sorted(translate_result.keys()):
-        print(f"  - {key}: {type(translate_result[key]).__name__}")
+    if verbose:
+        print("\nTranslation result keys:")
+        for key in sorted(translate_result.keys()):
+            print(f"  - {key}: {type(translate_result[key]).__name__}")
 
     # Display workpiece data after translation (if modified)
-    if "workpiece" in translate_result:
+    if verbose and "workpiece" in translate_result:
         workpiece_after = translate_result["workpiece"]
         print("\nWorkpiece after translation:")
         for key, value in sorted(workpiece_after.items()):
             if key == "corner_points":
                 print(f"  {key}:")
                 for i, point in enumerate(value):
-                    print(f"    Point {i}: ({point[0]:.1f}, {point[1]:.1f}, {point[2]:.1f})")
+                    print(f"    Point {i}: {format_point(point)}")
             else:
                 print(f"  {key}: {value}")
 
@@ -151,7 +169,7 @@ def process_dxf_file(dxf_file_path):
     print(f"\nTRANSLATED POINTS: {len(translated_points)} total")
     print("-" * 80)
 
-    if translated_points:
+    if verbose and translated_points:
         # Show keys in first translated point
         first_point = translated_points[0]
         print("Translated point structure (keys in first point):")
@@ -165,8 +183,7 @@ def process_dxf_file(dxf_file_path):
             for key, value in sorted(point.items()):
                 # Format position tuples for better readability
                 if key in ("position", "original_position") and isinstance(value, tuple):
-                    x, y, z = value
-                    print(f"  {key}: ({x:.1f}, {y:.1f}, {z:.1f})")
+                    print(f"  {key}: {format_point(value)}")
                 else:
                     print(f"  {key}: {value}")
 
@@ -182,8 +199,8 @@ def process_dxf_file(dxf_file_path):
         direction = point.get("direction", (0, 0, 0))
 
         # Format position strings with proper rounding
-        orig_pos_str = f"({orig_pos[0]:.1f}, {orig_pos[1]:.1f}, {orig_pos[2]:.1f})"
-        pos_str = f"({pos[0]:.1f}, {pos[1]:.1f}, {pos[2]:.1f})"
+        orig_pos_str = format_point(orig_pos)
+        pos_str = format_point(pos)
         dir_str = str(direction)
 
         print(f"{i:^5} {orig_pos_str:^30} {pos_str:^30} {dir_str:^20}")
@@ -192,8 +209,13 @@ def process_dxf_file(dxf_file_path):
     return True, "DXF pipeline completed successfully", translate_result
 
 
-def main():
-    """Main function to run the DXF pipeline test."""
+def main(verbose: bool = False):
+    """
+    Main function to run the DXF pipeline test.
+
+    Args:
+        verbose: Whether to dump the full structure of the pipeline results
+    """
     UIUtils.print_separator("DXF Processing Pipeline Test")
 
     # Get path to test data directory using cross-platform approach
@@ -228,7 +250,7 @@ def main():
         return
 
     # Process the DXF file through the pipeline
-    success, message, result = process_dxf_file(dxf_file)
+    success, message, result = process_dxf_file(dxf_file, verbose)
 
     # Print final result
     if success:
@@ -245,11 +267,9 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        main(verbose="--verbose" in sys.argv[1:])
     except Exception as e:
         print(f"\nERROR: An unexpected error occurred: {e!s}")
-        import traceback
-
         traceback.print_exc()
         # Keep console open on error
         UIUtils.keep_terminal_open("An error occurred during processing.")
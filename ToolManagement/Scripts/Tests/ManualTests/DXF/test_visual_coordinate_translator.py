@@ -7,6 +7,7 @@ to physical workpiece space for horizontal drilling operations.
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Path setup for imports
@@ -15,6 +16,9 @@ scripts_dir = current_dir.parent.parent.parent
 if str(scripts_dir) not in sys.path:
     sys.path.insert(0, str(scripts_dir))
 
+# Test data location, resolved once
+TEST_DATA_DIR = current_dir.parent.parent / "TestData" / "DXF"
+
 # Import modules to test
 from DXF.extractor import DXFExtractor
 from DXF.parser import DXFParser
@@ -35,6 +39,45 @@ def print_subheader(title: str) -> None:
     print("-" * 50 + "\n")
 
 
+def classify_direction(direction: tuple | list | None) -> str | None:
+    """
+    Classify a direction vector by drilling axis.
+
+    Shared by the diagnostics and translation tables so both classify points
+    the same way, including list vectors and malformed directions.
+
+    Returns:
+        "X" or "Y" for horizontal drilling, "Z" for vertical, None otherwise
+    """
+    try:
+        x, y, z = direction
+    except (TypeError, ValueError):
+        return None
+
+    if abs(x) == 1.0 and y == 0.0 and z == 0.0:
+        return "X"
+    if x == 0.0 and abs(y) == 1.0 and z == 0.0:
+        return "Y"
+    if x == 0.0 and y == 0.0 and abs(z) == 1.0:
+        return "Z"
+    return None
+
+
+@lru_cache(maxsize=4)
+def _parse_dxf(file_path: str, mtime: float) -> tuple[bool, str, dict]:
+    """Parse a DXF file; cached per (path, mtime) so edited files are re-read."""
+    return DXFParser().parse(file_path)
+
+
+def parse_dxf_cached(file_path: str | Path) -> tuple[bool, str, dict]:
+    """Parse a DXF file, reusing the document if it was already parsed in this session."""
+    file_path = str(file_path)
+    if not os.path.exists(file_path):
+        # Let the parser report the missing file
+        return DXFParser().parse(file_path)
+    return _parse_dxf(file_path, os.path.getmtime(file_path))
+
+
 def print_drill_points_table(drill_points: list[dict]) -> None:
     """Print a formatted table of drill points."""
     # Print header
@@ -74,29 +117,21 @@ def print_direction_vector_diagnostics(drill_points: list[dict]) -> None:
         direction = point.get("direction", None)
         direction_type = type(direction).__name__
 
-        # Check drilling direction
-        is_x_direction = False
-        is_y_direction = False
-        is_z_direction = False
-
         # Extract vector components for analysis
         try:
             x, y, z = direction
             # Print detailed values to understand what's happening
             print(f"  Components: x={x} (type: {type(x)}), y={y}, z={z}")
             print(f"  Checks: abs(x)==1.0: {abs(x) == 1.0}, y==0.0: {y == 0.0}, z==0.0: {z == 0.0}")
-
-            is_x_direction = abs(x) == 1.0 and y == 0.0 and z == 0.0
-            is_y_direction = x == 0.0 and abs(y) == 1.0 and z == 0.0
-            is_z_direction = x == 0.0 and y == 0.0 and abs(z) == 1.0
         except (TypeError, ValueError) as e:
             print(f"  Error unpacking direction: {e!s}")
 
-        if is_x_direction:
+        axis = classify_direction(direction)
+        if axis == "X":
             drilling_str = "X-direction (horizontal)"
-        elif is_y_direction:
+        elif axis == "Y":
             drilling_str = "Y-direction (horizontal)"
-        elif is_z_direction:
+        elif axis == "Z":
             drilling_str = "Z-direction (vertical)"
         else:
             drilling_str = "Unsupported"
@@ -118,15 +153,8 @@ def print_translated_points_table(
         translated_originals = []
         for orig_point in original_points:
             direction = orig_point.get("direction", (0, 0, 0))
-            try:
-                x, y, z = direction
-                is_x_direction = abs(x) == 1.0 and y == 0.0 and z == 0.0
-                is_y_direction = x == 0.0 and abs(y) == 1.0 and z == 0.0
-
-                if is_x_direction or is_y_direction:
-                    translated_originals.append(orig_point)
-            except (ValueError, TypeError):
-                pass
+            if classify_direction(direction) in ("X", "Y"):
+                translated_originals.append(orig_point)
 
         # Map by index position
         for i, trans_point in enumerate(translated_points):
@@ -222,9 +250,8 @@ def process_file(file_path: str) -> None:
     """Process a DXF file and demonstrate coordinate translation."""
     print_subheader(f"Processing file: {os.path.basename(file_path)}")
 
-    # Parse the DXF file
-    parser = DXFParser()
-    parse_success, parse_message, parse_result = parser.parse(file_path)
+    # Parse the DXF file (cached across menu runs)
+    parse_success, parse_message, parse_result = parse_dxf_cached(file_path)
 
     if not parse_success:
         print(f"ERROR: {parse_message}")
@@ -281,12 +308,8 @@ def process_file(file_path: str) -> None:
 
 def select_file() -> str:
     """Present a menu to select a test file."""
-    # Get path to test DXF files
-    test_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../TestData/DXF"))
-
     # List available DXF files
-    dxf_files = [f for f in os.listdir(test_data_dir) if f.endswith(".dxf")]
-    dxf_files.sort()
+    dxf_files = sorted(path.name for path in TEST_DATA_DIR.glob("*.dxf"))
 
     # Show all available DXF files
     test_files = dxf_files
@@ -311,7 +334,7 @@ def select_file() -> str:
             if option == len(test_files) + 1:
                 return "ALL"
             if 1 <= option <= len(test_files):
-                return os.path.join(test_data_dir, test_files[option - 1])
+                return str(TEST_DATA_DIR / test_files[option - 1])
             print("Invalid option. Please try again.")
         except ValueError:
             print("Invalid option. Please try again.")
@@ -324,8 +347,6 @@ def test_specific_file(file_path: str) -> None:
 
 def test_all_files() -> None:
     """Test coordinate translation on all valid test files."""
-    test_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../TestData/DXF"))
-
     # Valid files for testing horizontal drilling
     valid_test_files = [
         "Bottom_2_f0.dxf",
@@ -338,8 +359,8 @@ def test_all_files() -> None:
     # Test valid files
     print_subheader("Testing Valid DXF Files")
     for file_name in valid_test_files:
-        file_path = os.path.join(test_data_dir, file_name)
-        if os.path.exists(file_path):
+        file_path = TEST_DATA_DIR / file_name
+        if file_path.exists():
             process_file(file_path)
 
 
@@ -376,8 +397,7 @@ if __name__ == "__main__":
 
     if len(sys.argv) > 1 and sys.argv[1] == "--diagnose":
         print_header("Running Automated Diagnostics")
-        test_data_dir = Path(__file__).parent.parent.parent / "TestData" / "DXF"
-        test_file = test_data_dir / "Bottom_2_f0.dxf"  # Test with X-direction drilling
+        test_file = TEST_DATA_DIR / "Bottom_2_f0.dxf"  # Test with X-direction drilling
         if test_file.exists():
             process_file(test_file)
         else:
@@ -41,6 +41,9 @@ def print_drill_points_table(drill_points: list[dict]) -> None:
     )
     print("-" * 85)
 
+    # Format every row with one reusable template and print them in one call
+    row_format = "{:<4} {:<30} {:<15.2f} mm {:<15} {!s:<20}"
+    rows = []
     for i, point in enumerate(drill_points, 1):
         position = point.get("position", (0, 0, 0))
         diameter = point.get("diameter", 0)
@@ -48,15 +51,19 @@ def print_drill_points_table(drill_points: list[dict]) -> None:
         # Handle direction from either extrusion_vector or direction
         direction = point.get("extrusion_vector", point.get("direction", (0, 0, 0)))
 
-        # Format values for display
-        position_str = "({:.1f}, {:.1f}, {:.1f})".format(*position)
-        direction_str = "({}, {}, {})".format(*direction)
-        group_key = point.get("group_key", "None")
-
-        print(
-            f"{i:<4} {position_str:<30} {diameter:<15.2f} mm {direction_str:<15} {group_key!s:<20}"
+        rows.append(
+            row_format.format(
+                i,
+                "({:.1f}, {:.1f}, {:.1f})".format(*position),
+                diameter,
+                "({}, {}, {})".format(*direction),
+                point.get("group_key", "None"),
+            )
         )
 
+    if rows:
+        print("\n".join(rows))
+
     print("-" * 85)
 
 
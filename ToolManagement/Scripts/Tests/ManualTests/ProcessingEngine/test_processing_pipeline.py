@@ -20,6 +20,10 @@ if str(scripts_dir) not in sys.path:
 from ProcessingEngine.drill_point_grouper import DrillPointGrouper
 from ProcessingEngine.machine_positioner import MachinePositioner
 from ProcessingEngine.workpiece_rotator import WorkpieceRotator
+from Utils.logging_utils import setup_logger
+
+# Set up logger
+logger = setup_logger(__name__)
 
 
 def print_header(title: str) -> None:
@@ -75,29 +79,33 @@ def print_json_summary(data: dict, title: str = None) -> None:
         drill_points = data["drill_points"]
         print(f"\nDrill Points: {len(drill_points)} points")
 
-        # Print all points with full information
+        # Collect all point lines and emit them with a single write
+        lines = []
         for i, point in enumerate(drill_points, 1):
             position = point.get("position", "N/A")
             diameter = point.get("diameter", "N/A")
             direction = point.get("extrusion_vector", point.get("direction", "N/A"))
 
-            print(f"\n  Point {i}:")
-            print(f"    Position: {position}")
+            lines.append(f"\n  Point {i}:")
+            lines.append(f"    Position: {position}")
 
-            # Print original position if available
+            # Add original position if available
             if "original_position" in point:
-                print(f"    Original Position: {point['original_position']}")
+                lines.append(f"    Original Position: {point['original_position']}")
 
-            # Print machine position if available
+            # Add machine position if available
             if "machine_position" in point:
-                print(f"    Machine Position: {point['machine_position']}")
+                lines.append(f"    Machine Position: {point['machine_position']}")
 
-            print(f"    Diameter: {diameter}")
-            print(f"    Direction: {direction}")
+            lines.append(f"    Diameter: {diameter}")
+            lines.append(f"    Direction: {direction}")
 
-            # Print group key if available
+            # Add group key if available
             if "group_key" in point:
-                print(f"    Group Key: {point['group_key']}")
+                lines.append(f"    Group Key: {point['group_key']}")
+
+        if lines:
+            print("\n".join(lines))
 
     # Check for grouped points
     if "grouped_points" in data:
@@ -107,8 +115,12 @@ def print_json_summary(data: dict, title: str = None) -> None:
         print(f"\nGrouped Points: {group_count} groups")
 
         # Show group summaries
-        for i, ((diameter, direction), points) in enumerate(grouped_points.items(), 1):
-            print(f"  Group {i}: {len(points)} points with {diameter}mm, direction={direction}")
+        lines = [
+            f"  Group {i}: {len(points)} points with {diameter}mm, direction={direction}"
+            for i, ((diameter, direction), points) in enumerate(grouped_points.items(), 1)
+        ]
+        if lines:
+            print("\n".join(lines))
 
 
 def print_module_result(success: bool, message: str, additional_info: str = None) -> None:
@@ -245,6 +257,8 @@ def run_full_pipeline(data: dict, rotation_steps: int = 1) -> dict | None:
 
 def test_pipeline_with_different_rotations() -> None:
     """Test the pipeline with different rotation configurations."""
+    # Configurations go cheapest first (fewest rotations), so a broken stage
+    # fails on the simplest run and the remaining reports are not printed
     for rotations in range(4):
         print_header(f"TESTING WITH {rotations} ROTATIONS")
 
@@ -257,6 +271,12 @@ def test_pipeline_with_different_rotations() -> None:
         # Separator between tests
         print("\n" + "=" * 70 + "\n")
 
+        if result is None:
+            logger.error("Pipeline failed with %d rotations, skipping the rest", rotations)
+            return
+
+        logger.info("Pipeline passed with %d rotations", rotations)
+
 
 def interactive_menu() -> None:
     """Display an interactive menu for testing."""
@@ -0,0 +1,136 @@
+"""
+Manual timing benchmark for the per-point and per-group hot paths.
+
+This script times VisualCoordinateTranslator.translate_coordinates and
+ToolMatcher.match_tool_to_group on synthetic inputs, so performance changes
+can be compared before and after a code change. With --check it also fails
+when a timing exceeds its budget.
+
+Usage:
+    python benchmark_hot_paths.py           # Print timings
+    python benchmark_hot_paths.py --check   # Exit with status 1 if over budget
+"""
+
+import csv
+import random
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+# Path setup for imports
+current_dir = Path(__file__).parent.absolute()
+scripts_dir = current_dir.parent.parent
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+# Import modules to benchmark
+from DXF.visual_coordinate_translator import VisualCoordinateTranslator
+from GCodeGenerator.tool_matcher import ToolMatcher
+from Utils.logging_utils import setup_logger
+
+# Set up logger
+logger = setup_logger(__name__)
+
+# Generous per-call budgets in milliseconds, meant to catch regressions
+# such as re-reading the tool CSV on every match
+BUDGETS_MS = {
+    "translate_coordinates (1000 points)": 50.0,
+    "translate_coordinates (10000 points)": 500.0,
+    "match_tool_to_group (1000 tools)": 5.0,
+}
+
+WORKPIECE = {"width": 555.0, "height": 545.0, "thickness": 22.5}
+HORIZONTAL_VECTORS = [(1.0, 0.0, 0.0), (-1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, -1.0, 0.0)]
+
+
+def build_drill_points(count: int, seed: int = 0) -> list[dict]:
+    """Build a list of synthetic horizontal drill points."""
+    rng = random.Random(seed)
+    return [
+        {
+            "position": (
+                rng.uniform(-WORKPIECE["width"], WORKPIECE["width"]),
+                rng.uniform(-WORKPIECE["thickness"], 0.0),
+                rng.uniform(-WORKPIECE["height"], 0.0),
+            ),
+            "diameter": rng.choice((5.0, 8.0, 10.0)),
+            "depth": 20.0,
+            "extrusion_vector": rng.choice(HORIZONTAL_VECTORS),
+            "layer": "EDGE.DRILL_D8.0_P20.0",
+        }
+        for _ in range(count)
+    ]
+
+
+def write_tool_data(file_path: Path, count: int) -> None:
+    """Write a synthetic tool data CSV with the given number of tools."""
+    with open(file_path, "w", newline="") as f:
+        writer = csv.DictWriter(
+            f, fieldnames=["tool_number", "tool_type", "tool_direction", "diameter"]
+        )
+        writer.writeheader()
+        for tool_number in range(1, count + 1):
+            writer.writerow(
+                {
+                    "tool_number": tool_number,
+                    "tool_type": "HorizontalDrill",
+                    "tool_direction": tool_number % 5 + 1,
+                    "diameter": f"{tool_number * 0.05:.2f}",
+                }
+            )
+
+
+def time_call(func, repeat: int = 5, number: int = 10) -> float:
+    """Return the best per-call time of func in milliseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+def run_benchmarks() -> dict[str, float]:
+    """Run all benchmarks and return per-call timings in milliseconds."""
+    results = {}
+
+    translator = VisualCoordinateTranslator()
+    for count in (1000, 10000):
+        drill_points = build_drill_points(count)
+        results[f"translate_coordinates ({count} points)"] = time_call(
+            lambda points=drill_points: translator.translate_coordinates(points, WORKPIECE),
+            number=1 if count > 1000 else 10,
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tool_data_path = Path(temp_dir) / "tool-data.csv"
+        write_tool_data(tool_data_path, 1000)
+
+        matcher = ToolMatcher(str(tool_data_path))
+        group_key = (25.0, (1.0, 0.0, 0.0))
+        success, message, _ = matcher.match_tool_to_group(group_key)
+        if not success:
+            logger.error("Tool matching failed: %s", message)
+        results["match_tool_to_group (1000 tools)"] = time_call(
+            lambda: matcher.match_tool_to_group(group_key), number=100
+        )
+
+    return results
+
+
+def main(check: bool = False) -> int:
+    """Print benchmark timings and optionally compare them to the budgets."""
+    print("Hot Path Benchmarks")
+    print("-------------------")
+
+    over_budget = []
+    for name, elapsed_ms in run_benchmarks().items():
+        budget_ms = BUDGETS_MS[name]
+        print(f"{name:<40} {elapsed_ms:>10.3f} ms  (budget {budget_ms:.1f} ms)")
+        if elapsed_ms > budget_ms:
+            over_budget.append(name)
+
+    if check and over_budget:
+        print(f"\nOver budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(check="--check" in sys.argv[1:]))
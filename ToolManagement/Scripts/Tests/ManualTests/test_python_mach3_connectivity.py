@@ -31,15 +31,17 @@ os.makedirs(log_dir, exist_ok=True)
 # Log execution
 log_file = os.path.join(log_dir, "python_test_log.txt")
 print(f"Writing to log file: {log_file}")
-with open(log_file, "a") as f:
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    f.write(f"{timestamp} - Python-Mach3 connectivity test ran successfully\n")
+timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+# Write pre-encoded bytes in one call; os.linesep keeps the line endings text mode produced
+log_entry = f"{timestamp} - Python-Mach3 connectivity test ran successfully{os.linesep}"
+with open(log_file, "ab") as f:
+    f.write(log_entry.encode("ascii"))
 
 # Create status file for Mach3 to detect
 status_file = os.path.join(log_dir, "execution_status.txt")
 print(f"Creating status file: {status_file}")
-with open(status_file, "w") as f:
-    f.write("SUCCESS")
+with open(status_file, "wb") as f:
+    f.write(b"SUCCESS")
 
 print("\nRESULTS:")
 print("✓ Log directory created/confirmed")
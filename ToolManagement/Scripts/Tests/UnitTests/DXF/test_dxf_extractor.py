@@ -9,9 +9,7 @@ This module contains comprehensive unit tests for the extractor classes:
 Tests cover normal operation, edge cases, and error handling.
 """
 
-import os
 import sys
-import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -29,54 +27,30 @@ if str(scripts_dir) not in sys.path:
 import ezdxf
 
 from DXF.extractor import DXFExtractor
-from DXF.parser import DXFParser
 
 
 class TestDXFExtractor(unittest.TestCase):
     """Tests for the DXFExtractor class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the test documents once for all test methods."""
+        # The extractor works on in-memory documents, so there is no need to
+        # save them to disk and parse them back. Extraction only reads the
+        # documents, so they can be shared between test methods
+        cls.valid_doc = cls._build_valid_doc()
+        cls.missing_workpiece_doc = cls._build_missing_workpiece_doc()
+        cls.missing_drills_doc = cls._build_missing_drills_doc()
+
     def setUp(self):
         """Set up test environment before each test method."""
         # Initialize DXF extractor
         self.extractor = DXFExtractor()
 
-        # Create temporary test files
-        self.test_files = []
-
-        # Create test file with valid data
-        self.valid_file = self._create_valid_file()
-        self.test_files.append(self.valid_file)
-
-        # Create test file with missing workpiece
-        self.missing_workpiece_file = self._create_missing_workpiece_file()
-        self.test_files.append(self.missing_workpiece_file)
-
-        # Create test file with missing drill points
-        self.missing_drills_file = self._create_missing_drills_file()
-        self.test_files.append(self.missing_drills_file)
-
-        # Parse the test files
-        self.parser = DXFParser()
-        self.documents = {}
-
-        for file_path in self.test_files:
-            success, _, result = self.parser.parse(file_path)
-            if success:
-                self.documents[file_path] = result["document"]
-
-    def tearDown(self):
-        """Clean up test environment after each test method."""
-        # Remove test files
-        for file_path in self.test_files:
-            if os.path.exists(file_path):
-                try:
-                    os.unlink(file_path)
-                except:
-                    pass
-
-    def _create_valid_file(self):
-        """Create a test file with both workpiece and drill points."""
-        # Create a new DXF file
+    @staticmethod
+    def _build_valid_doc():
+        """Build a test document with both workpiece and drill points."""
+        # Create a new DXF document
         doc = ezdxf.new("R2010")
         msp = doc.modelspace()
 
@@ -92,14 +66,12 @@ class TestDXFExtractor(unittest.TestCase):
             center=(200, 100, 0), radius=5.0, dxfattribs={"layer": "EDGE.DRILL_D10.0_P20.0"}
         )
 
-        # Save to a temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".dxf", delete=False)
-        doc.saveas(temp_file.name)
-        return temp_file.name
+        return doc
 
-    def _create_missing_workpiece_file(self):
-        """Create a test file with drill points but no workpiece."""
-        # Create a new DXF file
+    @staticmethod
+    def _build_missing_workpiece_doc():
+        """Build a test document with drill points but no workpiece."""
+        # Create a new DXF document
         doc = ezdxf.new("R2010")
         msp = doc.modelspace()
 
@@ -111,14 +83,12 @@ class TestDXFExtractor(unittest.TestCase):
             center=(200, 100, 0), radius=5.0, dxfattribs={"layer": "EDGE.DRILL_D10.0_P20.0"}
         )
 
-        # Save to a temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".dxf", delete=False)
-        doc.saveas(temp_file.name)
-        return temp_file.name
+        return doc
 
-    def _create_missing_drills_file(self):
-        """Create a test file with workpiece but no drill points."""
-        # Create a new DXF file
+    @staticmethod
+    def _build_missing_drills_doc():
+        """Build a test document with workpiece but no drill points."""
+        # Create a new DXF document
         doc = ezdxf.new("R2010")
         msp = doc.modelspace()
 
@@ -126,18 +96,12 @@ class TestDXFExtractor(unittest.TestCase):
         points = [(0, 0), (500, 0), (500, 400), (0, 400), (0, 0)]
         msp.add_lwpolyline(points, dxfattribs={"layer": "PANEL_Egger22mm"})
 
-        # Save to a temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".dxf", delete=False)
-        doc.saveas(temp_file.name)
-        return temp_file.name
+        return doc
 
     def test_process_valid_file(self):
         """Test processing a valid DXF file with both workpiece and drill points."""
-        document = self.documents.get(self.valid_file)
-        self.assertIsNotNone(document, "Failed to parse test file")
-
         # Process the document
-        success, message, result = self.extractor.process(document)
+        success, message, result = self.extractor.process(self.valid_doc)
 
         # Check extraction succeeded
         self.assertTrue(success)
@@ -157,11 +121,8 @@ class TestDXFExtractor(unittest.TestCase):
 
     def test_missing_workpiece(self):
         """Test that extraction fails when workpiece is missing."""
-        document = self.documents.get(self.missing_workpiece_file)
-        self.assertIsNotNone(document, "Failed to parse test file")
-
         # Process the document
-        success, message, _ = self.extractor.process(document)
+        success, message, _ = self.extractor.process(self.missing_workpiece_doc)
 
         # Check extraction failed
         self.assertFalse(success)
@@ -169,16 +130,22 @@ class TestDXFExtractor(unittest.TestCase):
 
     def test_missing_drill_points(self):
         """Test that extraction fails when drill points are missing."""
-        document = self.documents.get(self.missing_drills_file)
-        self.assertIsNotNone(document, "Failed to parse test file")
-
         # Process the document
-        success, message, _ = self.extractor.process(document)
+        success, message, _ = self.extractor.process(self.missing_drills_doc)
 
         # Check extraction failed
         self.assertFalse(success)
         self.assertIn("drill point", message.lower())
 
+
+class TestDXFExtractorReporting(unittest.TestCase):
+    """Tests for DXFExtractor result reporting that need no parsed DXF files."""
+
+    def setUp(self):
+        """Set up test environment before each test method."""
+        # Initialize DXF extractor
+        self.extractor = DXFExtractor()
+
     def test_skipped_points_reporting(self):
         """Test that skipped drill points are properly reported."""
         # Create a mock document
@@ -9,6 +9,7 @@ import argparse
 import logging
 import sys
 import unittest
+from functools import lru_cache
 from pathlib import Path
 
 # Path setup for both running the test directly and through run_tests.py
@@ -34,6 +35,27 @@ logging.disable(logging.CRITICAL)
 from DXF.parser import DXFParser
 
 
+@lru_cache(maxsize=8)
+def _cached_load(path_str: str) -> tuple[DXFParser, tuple]:
+    """
+    Load a DXF file once and reuse the parser across test methods.
+
+    Args:
+        path_str: Path to the DXF file as a string
+
+    Returns:
+        Tuple of (parser, load_result) where load_result is the
+        (success, message, details) tuple returned by load_file
+    """
+    parser = DXFParser()
+    return parser, parser.load_file(path_str)
+
+
+def tearDownModule():
+    """Release the cached DXF documents after the module's tests have run."""
+    _cached_load.cache_clear()
+
+
 class TestDXFParser(unittest.TestCase):
     """Tests for the DXFParser class."""
 
@@ -68,7 +90,7 @@ class TestDXFParser(unittest.TestCase):
 
     def test_load_valid_file(self):
         """Test loading a valid DXF file."""
-        success, message, result = self.parser.load_file(self.valid_file)
+        parser, (success, message, result) = _cached_load(str(self.valid_file))
 
         # Check successful loading
         self.assertTrue(success)
@@ -76,7 +98,7 @@ class TestDXFParser(unittest.TestCase):
         self.assertGreater(result.get("entity_count", 0), 0)
 
         # Check that file path was stored
-        self.assertEqual(str(self.parser.file_path), str(self.valid_file))
+        self.assertEqual(str(parser.file_path), str(self.valid_file))
 
     def test_load_nonexistent_file(self):
         """Test loading a non-existent file."""
@@ -88,11 +110,11 @@ class TestDXFParser(unittest.TestCase):
 
     def test_get_file_info(self):
         """Test getting file information after loading a file."""
-        # First load a file
-        self.parser.load_file(self.valid_file)
+        # First load a file (get_file_info only reads the cached document)
+        parser, _ = _cached_load(str(self.valid_file))
 
         # Then get file info
-        success, message, result = self.parser.get_file_info()
+        success, message, result = parser.get_file_info()
 
         # Check file info results
         self.assertTrue(success)
@@ -22,12 +22,11 @@ from DXF.visual_coordinate_translator import VisualCoordinateTranslator
 class TestVisualCoordinateTranslator(unittest.TestCase):
     """Test cases for the VisualCoordinateTranslator class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.translator = VisualCoordinateTranslator()
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only test data shared by all test methods."""
         # Sample workpiece data
-        self.workpiece = {
+        cls.workpiece = {
             "width": 555.0,
             "height": 570.0,
             "thickness": 22.5,
@@ -35,7 +34,7 @@ class TestVisualCoordinateTranslator(unittest.TestCase):
         }
 
         # Sample X-direction drill points
-        self.x_direction_points = [
+        cls.x_direction_points = (
             {
                 "position": (542.0, -9.5, 0.0),
                 "diameter": 8.0,
@@ -50,10 +49,10 @@ class TestVisualCoordinateTranslator(unittest.TestCase):
                 "direction": (-1.0, 0.0, 0.0),
                 "layer": "EDGE.DRILL_D8.0_P21.5",
             },
-        ]
+        )
 
         # Sample Y-direction drill points
-        self.y_direction_points = [
+        cls.y_direction_points = (
             {
                 "position": (-517.5, -9.5, 0.0),
                 "diameter": 8.0,
@@ -68,19 +67,23 @@ class TestVisualCoordinateTranslator(unittest.TestCase):
                 "direction": (0.0, -1.0, 0.0),
                 "layer": "EDGE.DRILL_D8.0_P21.5",
             },
-        ]
+        )
 
         # Expected translation results for X-direction points
-        self.expected_x_translations = [
+        cls.expected_x_translations = (
             (0.0, 28.0, 13.0),  # translated from (542.0, -9.5, 0.0)
             (555.0, 28.0, 13.0),  # translated from (-542.0, -9.5, -555.0)
-        ]
+        )
 
         # Expected translation results for Y-direction points
-        self.expected_y_translations = [
+        cls.expected_y_translations = (
             (37.5, 0.0, 13.0),  # translated from (-517.5, -9.5, 0.0)
             (37.5, 555.0, 13.0),  # translated from (517.5, -9.5, -555.0)
-        ]
+        )
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.translator = VisualCoordinateTranslator()
 
     def test_validate_workpiece(self):
         """Test workpiece validation."""
@@ -131,65 +134,57 @@ class TestVisualCoordinateTranslator(unittest.TestCase):
 
     def test_is_x_direction_drilling(self):
         """Test X-direction drilling detection."""
-        # Test positive X direction
-        self.assertTrue(self.translator._is_x_direction_drilling((1.0, 0.0, 0.0)))
-
-        # Test negative X direction
-        self.assertTrue(self.translator._is_x_direction_drilling((-1.0, 0.0, 0.0)))
+        cases = [
+            ((1.0, 0.0, 0.0), True),  # Positive X direction
+            ((-1.0, 0.0, 0.0), True),  # Negative X direction
+            ((0.0, 1.0, 0.0), False),  # Not X direction
+            ((0.0, 0.0, 1.0), False),
+            ((0.5, 0.5, 0.0), False),
+        ]
 
-        # Test not X direction
-        self.assertFalse(self.translator._is_x_direction_drilling((0.0, 1.0, 0.0)))
-        self.assertFalse(self.translator._is_x_direction_drilling((0.0, 0.0, 1.0)))
-        self.assertFalse(self.translator._is_x_direction_drilling((0.5, 0.5, 0.0)))
+        for vector, expected in cases:
+            with self.subTest(vector=vector):
+                self.assertEqual(self.translator._is_x_direction_drilling(vector), expected)
 
     def test_is_y_direction_drilling(self):
         """Test Y-direction drilling detection."""
-        # Test positive Y direction
-        self.assertTrue(self.translator._is_y_direction_drilling((0.0, 1.0, 0.0)))
-
-        # Test negative Y direction
-        self.assertTrue(self.translator._is_y_direction_drilling((0.0, -1.0, 0.0)))
+        cases = [
+            ((0.0, 1.0, 0.0), True),  # Positive Y direction
+            ((0.0, -1.0, 0.0), True),  # Negative Y direction
+            ((1.0, 0.0, 0.0), False),  # Not Y direction
+            ((0.0, 0.0, 1.0), False),
+            ((0.5, 0.5, 0.0), False),
+        ]
 
-        # Test not Y direction
-        self.assertFalse(self.translator._is_y_direction_drilling((1.0, 0.0, 0.0)))
-        self.assertFalse(self.translator._is_y_direction_drilling((0.0, 0.0, 1.0)))
-        self.assertFalse(self.translator._is_y_direction_drilling((0.5, 0.5, 0.0)))
+        for vector, expected in cases:
+            with self.subTest(vector=vector):
+                self.assertEqual(self.translator._is_y_direction_drilling(vector), expected)
 
     def test_translate_x_direction(self):
         """Test X-direction coordinate translation."""
-        # Test positive X direction
-        point = self.x_direction_points[0]
-        translated = self.translator._translate_x_direction(
-            point, point["position"], self.workpiece["height"], self.workpiece["thickness"]
-        )
+        # Positive and negative X direction points
+        for point, expected in zip(
+            self.x_direction_points, self.expected_x_translations, strict=True
+        ):
+            with self.subTest(position=point["position"]):
+                translated = self.translator._translate_x_direction(
+                    point, point["position"], self.workpiece["height"], self.workpiece["thickness"]
+                )
 
-        self.assertEqual(translated["position"], self.expected_x_translations[0])
-
-        # Test negative X direction
-        point = self.x_direction_points[1]
-        translated = self.translator._translate_x_direction(
-            point, point["position"], self.workpiece["height"], self.workpiece["thickness"]
-        )
-
-        self.assertEqual(translated["position"], self.expected_x_translations[1])
+                self.assertEqual(translated["position"], expected)
 
     def test_translate_y_direction(self):
         """Test Y-direction coordinate translation."""
-        # Test positive Y direction
-        point = self.y_direction_points[0]
-        translated = self.translator._translate_y_direction(
-            point, point["position"], self.workpiece["width"], self.workpiece["thickness"]
-        )
-
-        self.assertEqual(translated["position"], self.expected_y_translations[0])
-
-        # Test negative Y direction
-        point = self.y_direction_points[1]
-        translated = self.translator._translate_y_direction(
-            point, point["position"], self.workpiece["width"], self.workpiece["thickness"]
-        )
-
-        self.assertEqual(translated["position"], self.expected_y_translations[1])
+        # Positive and negative Y direction points
+        for point, expected in zip(
+            self.y_direction_points, self.expected_y_translations, strict=True
+        ):
+            with self.subTest(position=point["position"]):
+                translated = self.translator._translate_y_direction(
+                    point, point["position"], self.workpiece["width"], self.workpiece["thickness"]
+                )
+
+                self.assertEqual(translated["position"], expected)
 
     def test_translate_coordinates(self):
         """Test the main coordinate translation function."""
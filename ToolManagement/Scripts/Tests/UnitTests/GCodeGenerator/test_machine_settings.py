@@ -23,21 +23,24 @@ from Utils.config import AppConfig
 class TestMachineSettings(unittest.TestCase):
     """Test cases for the MachineSettings class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create machine settings with default configuration
-        self.settings = MachineSettings()
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only test data shared by all test methods."""
         # Test data
-        self.test_workpiece_small = {"width": 400.0, "height": 500.0, "thickness": 18.0}
-        self.test_workpiece_large = {"width": 400.0, "height": 700.0, "thickness": 18.0}
-        self.test_vectors = [
+        cls.test_workpiece_small = {"width": 400.0, "height": 500.0, "thickness": 18.0}
+        cls.test_workpiece_large = {"width": 400.0, "height": 700.0, "thickness": 18.0}
+        cls.test_vectors = (
             (1.0, 0.0, 0.0),  # X+
             (-1.0, 0.0, 0.0),  # X-
             (0.0, 1.0, 0.0),  # Y+
             (0.0, -1.0, 0.0),  # Y-
             (0.5, 0.5, 0.0),  # Invalid
-        ]
+        )
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Create machine settings with default configuration
+        self.settings = MachineSettings()
 
     def test_initialization_with_defaults(self):
         """Test initialization with default settings."""
@@ -113,32 +116,22 @@ class TestMachineSettings(unittest.TestCase):
 
     def test_get_vector_axis_info(self):
         """Test mapping of direction vectors to axis information."""
-        # Test valid vectors
-        x_pos_info = self.settings.get_vector_axis_info((1.0, 0.0, 0.0))
-        self.assertEqual(x_pos_info["axis"], "X")
-        self.assertEqual(x_pos_info["direction"], 1)
-        self.assertEqual(x_pos_info["description"], "X+")
-
-        x_neg_info = self.settings.get_vector_axis_info((-1.0, 0.0, 0.0))
-        self.assertEqual(x_neg_info["axis"], "X")
-        self.assertEqual(x_neg_info["direction"], -1)
-        self.assertEqual(x_neg_info["description"], "X-")
-
-        y_pos_info = self.settings.get_vector_axis_info((0.0, 1.0, 0.0))
-        self.assertEqual(y_pos_info["axis"], "Y")
-        self.assertEqual(y_pos_info["direction"], 1)
-        self.assertEqual(y_pos_info["description"], "Y+")
-
-        y_neg_info = self.settings.get_vector_axis_info((0.0, -1.0, 0.0))
-        self.assertEqual(y_neg_info["axis"], "Y")
-        self.assertEqual(y_neg_info["direction"], -1)
-        self.assertEqual(y_neg_info["description"], "Y-")
-
-        # Test invalid vector
-        invalid_info = self.settings.get_vector_axis_info((0.5, 0.5, 0.0))
-        self.assertEqual(invalid_info["axis"], "?")
-        self.assertEqual(invalid_info["direction"], 0)
-        self.assertEqual(invalid_info["description"], "Unknown")
+        cases = [
+            # Valid vectors
+            ((1.0, 0.0, 0.0), ("X", 1, "X+")),
+            ((-1.0, 0.0, 0.0), ("X", -1, "X-")),
+            ((0.0, 1.0, 0.0), ("Y", 1, "Y+")),
+            ((0.0, -1.0, 0.0), ("Y", -1, "Y-")),
+            # Invalid vector
+            ((0.5, 0.5, 0.0), ("?", 0, "Unknown")),
+        ]
+
+        for vector, (axis, direction, description) in cases:
+            with self.subTest(vector=vector):
+                info = self.settings.get_vector_axis_info(vector)
+                self.assertEqual(info["axis"], axis)
+                self.assertEqual(info["direction"], direction)
+                self.assertEqual(info["description"], description)
 
     def test_get_coordinate_system(self):
         """Test coordinate system selection based on workpiece dimensions."""
@@ -5,7 +5,9 @@ This module tests the functionality of the ToolMatcher class
 which matches drilling operations to appropriate tools.
 """
 
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -18,6 +20,49 @@ if str(scripts_dir) not in sys.path:
 
 # Import module to test
 from GCodeGenerator.tool_matcher import ToolMatcher
+from Utils.file_utils import FileUtils
+
+# The real CSV reader, captured before setUp patches FileUtils.read_csv for each test
+REAL_READ_CSV = FileUtils.read_csv
+
+# Mock CSV data for testing instead of relying on external file (read-only,
+# so it is shared by every test)
+MOCK_CSV_DATA = {
+    "rows": (
+        {
+            "tool_number": "1",
+            "tool_type": "VerticalDrill",
+            "tool_direction": "5",
+            "diameter": "8.0",
+            "in_spindle": "1",
+            "description": "Vertical Drill 8mm",
+        },
+        {
+            "tool_number": "2",
+            "tool_type": "HorizontalDrill",
+            "tool_direction": "1",
+            "diameter": "10.0",
+            "in_spindle": "0",
+            "description": "Horizontal Drill 10mm X+",
+        },
+        {
+            "tool_number": "3",
+            "tool_type": "HorizontalDrill",
+            "tool_direction": "2",
+            "diameter": "10.0",
+            "in_spindle": "1",
+            "description": "Horizontal Drill 10mm X-",
+        },
+        {
+            "tool_number": "4",
+            "tool_type": "HorizontalDrill",
+            "tool_direction": "3",
+            "diameter": "12.0",
+            "in_spindle": "0",
+            "description": "Horizontal Drill 12mm Y+",
+        },
+    )
+}
 
 
 class TestToolMatcher(unittest.TestCase):
@@ -25,43 +70,7 @@ class TestToolMatcher(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        # Mock CSV data for testing instead of relying on external file
-        self.mock_csv_data = {
-            "rows": [
-                {
-                    "tool_number": "1",
-                    "tool_type": "VerticalDrill",
-                    "tool_direction": "5",
-                    "diameter": "8.0",
-                    "in_spindle": "1",
-                    "description": "Vertical Drill 8mm",
-                },
-                {
-                    "tool_number": "2",
-                    "tool_type": "HorizontalDrill",
-                    "tool_direction": "1",
-                    "diameter": "10.0",
-                    "in_spindle": "0",
-                    "description": "Horizontal Drill 10mm X+",
-                },
-                {
-                    "tool_number": "3",
-                    "tool_type": "HorizontalDrill",
-                    "tool_direction": "2",
-                    "diameter": "10.0",
-                    "in_spindle": "1",
-                    "description": "Horizontal Drill 10mm X-",
-                },
-                {
-                    "tool_number": "4",
-                    "tool_type": "HorizontalDrill",
-                    "tool_direction": "3",
-                    "diameter": "12.0",
-                    "in_spindle": "0",
-                    "description": "Horizontal Drill 12mm Y+",
-                },
-            ]
-        }
+        self.mock_csv_data = MOCK_CSV_DATA
 
         # Sample group keys for testing
         self.group_keys = [
@@ -72,115 +81,128 @@ class TestToolMatcher(unittest.TestCase):
             (6.0, (0.0, 0.0, 1.0)),  # 6mm vertical - no match
         ]
 
-    @patch("GCodeGenerator.tool_matcher.FileUtils.read_csv")
-    def test_match_tool_to_group_success(self, mock_read_csv):
-        """Test successful tool matching cases."""
-        # Setup mock
-        mock_read_csv.return_value = (True, "Success", self.mock_csv_data)
+        # Patch tool data reading for every test; tests may change the return value
+        patcher = patch(
+            "GCodeGenerator.tool_matcher.FileUtils.read_csv",
+            return_value=(True, "Success", self.mock_csv_data),
+        )
+        self.mock_read_csv = patcher.start()
+        self.addCleanup(patcher.stop)
 
         # Create matcher with mock tool data
-        matcher = ToolMatcher("mock_path")
+        self.matcher = ToolMatcher("mock_path")
 
+    def test_match_tool_to_group_success(self):
+        """Test successful tool matching cases."""
         # Test vertical drill match
-        success, message, result = matcher.match_tool_to_group(self.group_keys[0])
+        success, message, result = self.matcher.match_tool_to_group(self.group_keys[0])
         self.assertTrue(success)
         self.assertEqual(result["tool_number"], 1)
         self.assertEqual(result["diameter"], 8.0)
         self.assertEqual(result["direction"], 5)
 
         # Test horizontal X+ drill match
-        success, message, result = matcher.match_tool_to_group(self.group_keys[1])
+        success, message, result = self.matcher.match_tool_to_group(self.group_keys[1])
         self.assertTrue(success)
         self.assertEqual(result["tool_number"], 2)
         self.assertEqual(result["diameter"], 10.0)
         self.assertEqual(result["direction"], 1)
 
         # Test horizontal X- drill match
-        success, message, result = matcher.match_tool_to_group(self.group_keys[2])
+        success, message, result = self.matcher.match_tool_to_group(self.group_keys[2])
         self.assertTrue(success)
         self.assertEqual(result["tool_number"], 3)
         self.assertEqual(result["diameter"], 10.0)
         self.assertEqual(result["direction"], 2)
 
         # Test horizontal Y+ drill match
-        success, message, result = matcher.match_tool_to_group(self.group_keys[3])
+        success, message, result = self.matcher.match_tool_to_group(self.group_keys[3])
         self.assertTrue(success)
         self.assertEqual(result["tool_number"], 4)
         self.assertEqual(result["diameter"], 12.0)
         self.assertEqual(result["direction"], 3)
 
-    @patch("GCodeGenerator.tool_matcher.FileUtils.read_csv")
-    def test_match_tool_to_group_no_match(self, mock_read_csv):
+    def test_match_tool_to_group_no_match(self):
         """Test case where no matching tool is found."""
-        # Setup mock
-        mock_read_csv.return_value = (True, "Success", self.mock_csv_data)
-
-        # Create matcher with mock tool data
-        matcher = ToolMatcher("mock_path")
-
         # Test with diameter that doesn't exist in tool data
-        success, message, _ = matcher.match_tool_to_group(self.group_keys[4])
+        success, message, _ = self.matcher.match_tool_to_group(self.group_keys[4])
         self.assertFalse(success)
         self.assertIn("No exact diameter match found", message)
 
-    @patch("GCodeGenerator.tool_matcher.FileUtils.read_csv")
-    def test_invalid_direction_vector(self, mock_read_csv):
+    def test_invalid_direction_vector(self):
         """Test with invalid direction vector."""
-        # Setup mock
-        mock_read_csv.return_value = (True, "Success", self.mock_csv_data)
-
-        # Create matcher with mock tool data
-        matcher = ToolMatcher("mock_path")
-
         # Test with direction vector that doesn't map to a valid code
-        success, message, _ = matcher.match_tool_to_group((8.0, (0.5, 0.5, 0.0)))
+        success, message, _ = self.matcher.match_tool_to_group((8.0, (0.5, 0.5, 0.0)))
         self.assertFalse(success)
         self.assertIn("Unsupported direction vector", message)
 
-    @patch("GCodeGenerator.tool_matcher.FileUtils.read_csv")
-    def test_invalid_group_key(self, mock_read_csv):
+    def test_invalid_group_key(self):
         """Test with invalid group key format."""
-        # Setup mock
-        mock_read_csv.return_value = (True, "Success", self.mock_csv_data)
-
-        # Create matcher with mock tool data
-        matcher = ToolMatcher("mock_path")
-
         # Test with invalid group key (string instead of tuple)
-        success, message, _ = matcher.match_tool_to_group("invalid")
+        success, message, _ = self.matcher.match_tool_to_group("invalid")
         self.assertFalse(success)
         self.assertIn("Invalid group key format", message)
 
-    @patch("GCodeGenerator.tool_matcher.FileUtils.read_csv")
-    def test_csv_read_error(self, mock_read_csv):
+    def test_csv_read_error(self):
         """Test handling of CSV read error."""
         # Setup mock to return failure
-        mock_read_csv.return_value = (False, "Failed to read CSV", {})
-
-        # Create matcher with mock tool data
-        matcher = ToolMatcher("mock_path")
+        self.mock_read_csv.return_value = (False, "Failed to read CSV", {})
 
         # Test with valid group key but CSV read fails
-        success, message, _ = matcher.match_tool_to_group(self.group_keys[0])
+        success, message, _ = self.matcher.match_tool_to_group(self.group_keys[0])
         self.assertFalse(success)
         self.assertIn("Failed to read tool data", message)
 
+    def test_tool_data_read_once_while_unchanged(self):
+        """Test that the tool CSV is only read again after it changes."""
+        # Write a small tool data file
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as temp_file:
+            temp_file.write(
+                "tool_number,tool_direction,diameter,description\n42,5,8.0,Temp drill\n"
+            )
+        self.addCleanup(os.unlink, temp_file.name)
+
+        with patch(
+            "GCodeGenerator.tool_matcher.FileUtils.read_csv", wraps=REAL_READ_CSV
+        ) as mock_read_csv:
+            matcher = ToolMatcher(temp_file.name)
+
+            # Match twice against the unchanged file
+            for _ in range(2):
+                success, _, result = matcher.match_tool_to_group((8.0, (0.0, 0.0, 1.0)))
+                # The tool comes from the temporary file, not MOCK_CSV_DATA
+                self.assertTrue(success)
+                self.assertEqual(result["tool_number"], 42)
+                self.assertEqual(result["description"], "Temp drill")
+
+            self.assertEqual(mock_read_csv.call_count, 1)
+
+            # Touch the file with a new modification time
+            stat = os.stat(temp_file.name)
+            os.utime(temp_file.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            success, _, _ = matcher.match_tool_to_group((8.0, (0.0, 0.0, 1.0)))
+            self.assertTrue(success)
+            self.assertEqual(mock_read_csv.call_count, 2)
+
     def test_convert_vector_to_direction_code(self):
         """Test direction vector conversion."""
-        matcher = ToolMatcher("mock_path")
-
-        # Test all valid vectors
-        self.assertEqual(matcher._convert_vector_to_direction_code((1.0, 0.0, 0.0)), 1)
-        self.assertEqual(matcher._convert_vector_to_direction_code((-1.0, 0.0, 0.0)), 2)
-        self.assertEqual(matcher._convert_vector_to_direction_code((0.0, 1.0, 0.0)), 3)
-        self.assertEqual(matcher._convert_vector_to_direction_code((0.0, -1.0, 0.0)), 4)
-        self.assertEqual(matcher._convert_vector_to_direction_code((0.0, 0.0, 1.0)), 5)
+        cases = [
+            # All valid vectors
+            ((1.0, 0.0, 0.0), 1),
+            ((-1.0, 0.0, 0.0), 2),
+            ((0.0, 1.0, 0.0), 3),
+            ((0.0, -1.0, 0.0), 4),
+            ((0.0, 0.0, 1.0), 5),
+            # Invalid vector
+            ((0.5, 0.5, 0.0), None),
+        ]
 
-        # Test invalid vector
-        self.assertIsNone(matcher._convert_vector_to_direction_code((0.5, 0.5, 0.0)))
+        for vector, expected in cases:
+            with self.subTest(vector=vector):
+                self.assertEqual(self.matcher._convert_vector_to_direction_code(vector), expected)
 
-    @patch("GCodeGenerator.tool_matcher.FileUtils.read_csv")
-    def test_prepare_tool_data_for_response(self, mock_read_csv):
+    def test_prepare_tool_data_for_response(self):
         """Test formatting of tool data response."""
         # Create a raw tool record
         raw_tool = {
@@ -197,11 +219,8 @@ class TestToolMatcher(unittest.TestCase):
             "notes": "For special applications",
         }
 
-        # Create matcher
-        matcher = ToolMatcher("mock_path")
-
         # Call the method
-        formatted = matcher._prepare_tool_data_for_response(raw_tool)
+        formatted = self.matcher._prepare_tool_data_for_response(raw_tool)
 
         # Verify conversion of numeric fields
         self.assertEqual(formatted["tool_number"], 5)
@@ -22,12 +22,15 @@ from ProcessingEngine.drill_point_grouper import DrillPointGrouper
 class TestDrillPointGrouper(unittest.TestCase):
     """Test cases for the DrillPointGrouper class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.grouper = DrillPointGrouper()
+    @classmethod
+    def setUpClass(cls):
+        """Create the grouper once; it keeps no state between calls."""
+        cls.grouper = DrillPointGrouper()
 
+    def test_group_drilling_points(self):
+        """Test the main grouping function."""
         # Sample drill points with different diameters and directions
-        self.drill_points = [
+        drill_points = [
             {
                 "position": (100, 50, 0),
                 "extrusion_vector": (0, 0, 1),  # Z+
@@ -56,15 +59,13 @@ class TestDrillPointGrouper(unittest.TestCase):
         ]
 
         # Test data
-        self.test_data = {
-            "drill_points": self.drill_points,
+        test_data = {
+            "drill_points": drill_points,
             "workpiece": {"width": 600, "height": 400, "thickness": 20},
         }
 
-    def test_group_drilling_points(self):
-        """Test the main grouping function."""
         # Group the points
-        success, message, result = self.grouper.group_drilling_points(self.test_data)
+        success, message, result = self.grouper.group_drilling_points(test_data)
 
         # Verify success
         self.assertTrue(success)
@@ -22,134 +22,107 @@ from ProcessingEngine.machine_positioner import MachinePositioner
 class TestMachinePositioner(unittest.TestCase):
     """Test cases for the MachinePositioner class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.positioner = MachinePositioner()
-
-        # Sample workpiece data - a rectangular workpiece with corners in Q1
-        self.q1_workpiece = {
-            "width": 500,
-            "height": 300,
-            "thickness": 20,
-            "corner_points": [
-                (0, 0, 0),  # Origin
-                (0, 300, 0),  # Height edge
-                (500, 300, 0),  # Point C (opposite)
-                (500, 0, 0),  # Width edge
-            ],
-        }
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only test data shared by all test methods."""
+        # The positioner keeps no state between calls, so one instance is enough
+        cls.positioner = MachinePositioner()
+
+        # Sample 500 x 300 workpieces with corners in each quadrant; the Q1
+        # corners are listed in the opposite winding order to the others
+        cls.q1_workpiece = cls._make_workpiece(1, 1, reverse_winding=True)
+        cls.q2_workpiece = cls._make_workpiece(-1, 1)
+        cls.q3_workpiece = cls._make_workpiece(-1, -1)
+        cls.q4_workpiece = cls._make_workpiece(1, -1)
 
-        # Sample workpiece with corners in Q2
-        self.q2_workpiece = {
-            "width": 500,
-            "height": 300,
-            "thickness": 20,
-            "corner_points": [
-                (0, 0, 0),  # Origin
-                (-500, 0, 0),  # Width edge
-                (-500, 300, 0),  # Point C (opposite)
-                (0, 300, 0),  # Height edge
-            ],
-        }
+        # Sample drill points
+        cls.drill_points = (
+            {"position": (100, 100, 0), "extrusion_vector": (0, 0, 1), "diameter": 8.0},
+            {"position": (400, 200, 0), "extrusion_vector": (1, 0, 0), "diameter": 10.0},
+        )
 
-        # Sample workpiece with corners in Q3
-        self.q3_workpiece = {
-            "width": 500,
-            "height": 300,
-            "thickness": 20,
-            "corner_points": [
-                (0, 0, 0),  # Origin
-                (-500, 0, 0),  # Width edge
-                (-500, -300, 0),  # Point C (opposite)
-                (0, -300, 0),  # Height edge
-            ],
+        # Position each quadrant's workpiece once; several tests check the results
+        cls.positioned = {
+            quadrant: cls.positioner.position_for_top_left_machine(
+                {"workpiece": workpiece, "drill_points": cls.drill_points}
+            )
+            for quadrant, workpiece in (
+                ("Q1", cls.q1_workpiece),
+                ("Q2", cls.q2_workpiece),
+                ("Q3", cls.q3_workpiece),
+                ("Q4", cls.q4_workpiece),
+            )
         }
 
-        # Sample workpiece with corners in Q4
-        self.q4_workpiece = {
-            "width": 500,
-            "height": 300,
+    @staticmethod
+    def _make_workpiece(sign_x, sign_y, reverse_winding=False):
+        """
+        Build a 500 x 300 x 20 workpiece with one corner at the origin.
+
+        Args:
+            sign_x: Sign of the X coordinates of the width edge (1 or -1)
+            sign_y: Sign of the Y coordinates of the height edge (1 or -1)
+            reverse_winding: List the height edge before the width edge
+
+        Returns:
+            dict: Workpiece dictionary with dimensions and corner points
+        """
+        width, height = 500, 300
+        width_edge = (sign_x * width, 0, 0)
+        point_c = (sign_x * width, sign_y * height, 0)  # Opposite the origin
+        height_edge = (0, sign_y * height, 0)
+
+        edges = [width_edge, point_c, height_edge]
+        if reverse_winding:
+            edges.reverse()
+
+        return {
+            "width": width,
+            "height": height,
             "thickness": 20,
-            "corner_points": [
-                (0, 0, 0),  # Origin
-                (500, 0, 0),  # Width edge
-                (500, -300, 0),  # Point C (opposite)
-                (0, -300, 0),  # Height edge
-            ],
+            "corner_points": [(0, 0, 0), *edges],
         }
 
-        # Sample drill points
-        self.drill_points = [
-            {"position": (100, 100, 0), "extrusion_vector": (0, 0, 1), "diameter": 8.0},
-            {"position": (400, 200, 0), "extrusion_vector": (1, 0, 0), "diameter": 10.0},
+    def test_determine_offset(self):
+        """Test offset calculation for point C in each quadrant."""
+        cases = [
+            ((500, 300, 0), (0, -300)),  # Q1 rule: Apply (0, -y_c)
+            ((-500, 300, 0), (500, -300)),  # Q2 rule: Apply (-x_c, -y_c)
+            ((-500, -300, 0), (500, 0)),  # Q3 rule: Apply (-x_c, 0)
+            ((500, -300, 0), (0, 0)),  # Q4 rule: Apply (0, 0)
         ]
 
-    def test_determine_offset_q1(self):
-        """Test offset calculation for Q1 (x>0, y>0)."""
-        point_c = (500, 300, 0)
-        offset_x, offset_y = self.positioner._determine_offset(point_c[0], point_c[1])
-
-        # Q1 rule: Apply (0, -y_c)
-        self.assertEqual(offset_x, 0)
-        self.assertEqual(offset_y, -300)
+        for point_c, expected_offset in cases:
+            with self.subTest(point_c=point_c):
+                offset = self.positioner._determine_offset(point_c[0], point_c[1])
+                self.assertEqual(offset, expected_offset)
 
-    def test_determine_offset_q2(self):
-        """Test offset calculation for Q2 (x<0, y>0)."""
-        point_c = (-500, 300, 0)
-        offset_x, offset_y = self.positioner._determine_offset(point_c[0], point_c[1])
+    def test_determine_offset_sign_sweep(self):
+        """Test that each offset axis depends only on the sign of point C on that axis."""
+        for sign_x in (-1, 0, 1):
+            for sign_y in (-1, 0, 1):
+                with self.subTest(sign_x=sign_x, sign_y=sign_y):
+                    offset = self.positioner._determine_offset(sign_x * 500, sign_y * 300)
 
-        # Q2 rule: Apply (-x_c, -y_c)
-        self.assertEqual(offset_x, 500)
-        self.assertEqual(offset_y, -300)
-
-    def test_determine_offset_q3(self):
-        """Test offset calculation for Q3 (x<0, y<0)."""
-        point_c = (-500, -300, 0)
-        offset_x, offset_y = self.positioner._determine_offset(point_c[0], point_c[1])
-
-        # Q3 rule: Apply (-x_c, 0)
-        self.assertEqual(offset_x, 500)
-        self.assertEqual(offset_y, 0)
-
-    def test_determine_offset_q4(self):
-        """Test offset calculation for Q4 (x>0, y<0)."""
-        point_c = (500, -300, 0)
-        offset_x, offset_y = self.positioner._determine_offset(point_c[0], point_c[1])
-
-        # Q4 rule: Apply (0, 0)
-        self.assertEqual(offset_x, 0)
-        self.assertEqual(offset_y, 0)
+                    # Shift right only when C is left of the origin, and down
+                    # only when C is above it; points on an axis need no shift
+                    expected_x = 500 if sign_x < 0 else 0
+                    expected_y = -300 if sign_y > 0 else 0
+                    self.assertEqual(offset, (expected_x, expected_y))
 
     def test_apply_offset_to_coordinates(self):
         """Test applying offset to coordinates."""
-        # Test with positive offset
-        coords = (100, 100, 0)
-        offset = (50, 50)
-        new_coords = self.positioner._apply_offset_to_coordinates(coords, offset)
-
-        self.assertEqual(new_coords, (150.0, 150.0, 0))
-
-        # Test with negative offset
-        coords = (100, 100, 0)
-        offset = (-50, -50)
-        new_coords = self.positioner._apply_offset_to_coordinates(coords, offset)
-
-        self.assertEqual(new_coords, (50.0, 50.0, 0))
-
-        # Test with zero offset
-        coords = (100, 100, 0)
-        offset = (0, 0)
-        new_coords = self.positioner._apply_offset_to_coordinates(coords, offset)
-
-        self.assertEqual(new_coords, (100.0, 100.0, 0))
-
-        # Test with decimal values
-        coords = (100.5, 100.5, 0)
-        offset = (0.5, 0.5)
-        new_coords = self.positioner._apply_offset_to_coordinates(coords, offset)
+        cases = [
+            ((100, 100, 0), (50, 50), (150.0, 150.0, 0)),  # Positive offset
+            ((100, 100, 0), (-50, -50), (50.0, 50.0, 0)),  # Negative offset
+            ((100, 100, 0), (0, 0), (100.0, 100.0, 0)),  # Zero offset
+            ((100.5, 100.5, 0), (0.5, 0.5), (101.0, 101.0, 0)),  # Rounded to 0.1mm precision
+        ]
 
-        # Should be rounded to 0.1mm precision
-        self.assertEqual(new_coords, (101.0, 101.0, 0))
+        for coords, offset, expected in cases:
+            with self.subTest(coords=coords, offset=offset):
+                new_coords = self.positioner._apply_offset_to_coordinates(coords, offset)
+                self.assertEqual(new_coords, expected)
 
     def test_validate_workpiece_data(self):
         """Test workpiece data validation."""
@@ -166,11 +139,31 @@ class TestMachinePositioner(unittest.TestCase):
         success, message, _ = self.positioner._validate_workpiece_data(invalid_workpiece)
         self.assertFalse(success)
 
-    def test_position_for_top_left_machine_q1(self):
-        """Test positioning with workpiece in Q1."""
-        test_data = {"workpiece": self.q1_workpiece, "drill_points": self.drill_points}
+    def test_position_for_top_left_machine(self):
+        """Test positioning with the workpiece in each quadrant."""
+        cases = [
+            # (quadrant, expected offset, top-left corner index, corner position)
+            ("Q1", (0, -300), 1, (0, 0, 0)),
+            ("Q2", (500, -300), 3, (500, 0, 0)),
+            ("Q3", (500, 0), 3, (500, -300, 0)),
+            ("Q4", (0, 0), 3, (0, -300, 0)),
+        ]
+
+        for quadrant, expected_offset, corner_index, expected_corner in cases:
+            with self.subTest(quadrant=quadrant):
+                success, _, result = self.positioned[quadrant]
 
-        success, message, result = self.positioner.position_for_top_left_machine(test_data)
+                # Check success and offset calculation
+                self.assertTrue(success)
+                self.assertEqual(result["offset"], expected_offset)
+
+                # Check that the top-left corner is in its expected machine position
+                machine_corners = result["machine_corner_points"]
+                self.assertEqual(machine_corners[corner_index], expected_corner)
+
+    def test_position_for_top_left_machine_result(self):
+        """Test the positioning result structure and drill points for Q1."""
+        success, _, result = self.positioned["Q1"]
 
         # Check success and result structure
         self.assertTrue(success)
@@ -179,15 +172,8 @@ class TestMachinePositioner(unittest.TestCase):
         self.assertIn("machine_corner_points", result)
         self.assertIn("offset", result)
 
-        # Check offset calculation
-        self.assertEqual(result["offset"], (0, -300))
-
         # Check corner points transformation
-        machine_corners = result["machine_corner_points"]
-        self.assertEqual(len(machine_corners), 4)
-
-        # Check that the third corner (top-left) is now at origin
-        self.assertEqual(machine_corners[1], (0, 0, 0))
+        self.assertEqual(len(result["machine_corner_points"]), 4)
 
         # Check drill points transformation
         machine_drill_points = result["drill_points"]
@@ -199,54 +185,6 @@ class TestMachinePositioner(unittest.TestCase):
         # Second drill point should be offset by (0, -300)
         self.assertEqual(machine_drill_points[1]["machine_position"], (400, -100, 0))
 
-    def test_position_for_top_left_machine_q2(self):
-        """Test positioning with workpiece in Q2."""
-        test_data = {"workpiece": self.q2_workpiece, "drill_points": self.drill_points}
-
-        success, message, result = self.positioner.position_for_top_left_machine(test_data)
-
-        # Check success and result structure
-        self.assertTrue(success)
-
-        # Check offset calculation
-        self.assertEqual(result["offset"], (500, -300))
-
-        # Check that the height edge (top-left) is now at origin
-        machine_corners = result["machine_corner_points"]
-        self.assertEqual(machine_corners[3], (500, 0, 0))
-
-    def test_position_for_top_left_machine_q3(self):
-        """Test positioning with workpiece in Q3."""
-        test_data = {"workpiece": self.q3_workpiece, "drill_points": self.drill_points}
-
-        success, message, result = self.positioner.position_for_top_left_machine(test_data)
-
-        # Check success and result structure
-        self.assertTrue(success)
-
-        # Check offset calculation
-        self.assertEqual(result["offset"], (500, 0))
-
-        # Check that the height edge (top-left) is now at origin
-        machine_corners = result["machine_corner_points"]
-        self.assertEqual(machine_corners[3], (500, -300, 0))
-
-    def test_position_for_top_left_machine_q4(self):
-        """Test positioning with workpiece in Q4."""
-        test_data = {"workpiece": self.q4_workpiece, "drill_points": self.drill_points}
-
-        success, message, result = self.positioner.position_for_top_left_machine(test_data)
-
-        # Check success and result structure
-        self.assertTrue(success)
-
-        # Check offset calculation
-        self.assertEqual(result["offset"], (0, 0))
-
-        # Check that the height edge (top-left) is now at origin
-        machine_corners = result["machine_corner_points"]
-        self.assertEqual(machine_corners[3], (0, -300, 0))
-
     def test_invalid_input(self):
         """Test behavior with invalid input."""
         # Test with no data
@@ -6,6 +6,7 @@ This module contains unit tests for the backup_manager.py script.
 It tests the BackupRotation and BackupManager classes.
 """
 
+import filecmp
 import logging
 import os
 import shutil
@@ -13,11 +14,15 @@ import sys
 import tempfile
 import time
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
-# Add parent directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "Backups"))
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# Path setup for imports
+current_dir = Path(__file__).parent.absolute()
+scripts_dir = current_dir.parent.parent.parent
+for import_dir in (scripts_dir, scripts_dir / "Backups"):
+    if str(import_dir) not in sys.path:
+        sys.path.insert(0, str(import_dir))
 
 # Mock the setup_logger function to avoid logging issues
 with patch("Utils.logging_utils.setup_logger", return_value=logging.getLogger("backup_manager")):
@@ -34,16 +39,21 @@ class TestBackupRotation(unittest.TestCase):
         self.backup_dir = os.path.join(self.test_dir, "backups")
         os.makedirs(self.backup_dir, exist_ok=True)
 
-        # Create some test backup files
+        # Create some test backup files, one second apart and oldest first
+        base_time = time.time() - 60
         self.test_files = []
         for i in range(5):
             filename = f"test_{i}.csv"
             filepath = os.path.join(self.backup_dir, filename)
-            with open(filepath, "w") as f:
-                f.write(f"test data {i}")
+            Path(filepath).write_text(f"test data {i}")
+            os.utime(filepath, (base_time + i, base_time + i))
             self.test_files.append(filepath)
-            # Sleep to ensure different creation times
-            time.sleep(0.1)
+
+        # Creation times cannot be set directly, so let BackupRotation read the
+        # modification times set above instead of sleeping between files
+        patcher = patch.object(os.path, "getctime", os.path.getmtime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def tearDown(self):
         """Clean up the test environment"""
@@ -104,8 +114,7 @@ class TestBackupManager(unittest.TestCase):
         self.test_file = os.path.join(self.test_dir, "test_file.csv")
 
         # Create test file
-        with open(self.test_file, "w") as f:
-            f.write("test,data\n1,value1")
+        Path(self.test_file).write_text("test,data\n1,value1")
 
         # Create backup manager
         self.backup_mgr = BackupManager(self.backup_dir)
@@ -124,21 +133,7 @@ class TestBackupManager(unittest.TestCase):
         self.assertTrue(os.path.exists(details["backup_path"]))
 
         # Check backup content
-        with open(details["backup_path"]) as f:
-            content = f.read()
-        with open(self.test_file) as f:
-            original = f.read()
-
-        self.assertEqual(content, original)
-
-    def test_create_backup_missing_file(self):
-        """Test creating a backup of a non-existent file"""
-        missing_file = os.path.join(self.test_dir, "does_not_exist.csv")
-        success, message, details = self.backup_mgr.create_backup(missing_file)
-
-        # Check result
-        self.assertFalse(success)
-        self.assertIn("does not exist", message)
+        self.assertTrue(filecmp.cmp(details["backup_path"], self.test_file, shallow=False))
 
     def test_restore_from_backup(self):
         """Test restoring from a backup"""
@@ -161,24 +156,8 @@ class TestBackupManager(unittest.TestCase):
         self.assertTrue(os.path.exists(target_path))
 
         # Check restored content
-        with open(target_path) as f:
-            restored = f.read()
-        with open(self.test_file) as f:
-            modified = f.read()
-
-        self.assertNotEqual(restored, modified)
-        self.assertEqual(restored, "test,data\n1,value1")
-
-    def test_restore_missing_backup(self):
-        """Test restoring from a non-existent backup"""
-        missing_backup = os.path.join(self.backup_dir, "does_not_exist.csv")
-        target_path = os.path.join(self.test_dir, "restored_file.csv")
-
-        success, message, details = self.backup_mgr.restore_from_backup(missing_backup, target_path)
-
-        # Check result
-        self.assertFalse(success)
-        self.assertIn("does not exist", message)
+        self.assertFalse(filecmp.cmp(target_path, self.test_file, shallow=False))
+        self.assertEqual(Path(target_path).read_text(), "test,data\n1,value1")
 
     def test_restore_safety_backup(self):
         """Test that safety backup is created when restoring"""
@@ -195,5 +174,44 @@ class TestBackupManager(unittest.TestCase):
         self.assertTrue(os.path.exists(details["safety_backup"]))
 
 
+class TestBackupManagerMissingFiles(unittest.TestCase):
+    """Test BackupManager error handling for files that do not exist"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one backup manager for tests that never write files"""
+        # Create a temp directory for testing
+        cls.test_dir = tempfile.mkdtemp(prefix="backup_test_")
+        cls.backup_dir = os.path.join(cls.test_dir, "backups")
+
+        # Create backup manager
+        cls.backup_mgr = BackupManager(cls.backup_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the test environment"""
+        shutil.rmtree(cls.test_dir)
+
+    def test_create_backup_missing_file(self):
+        """Test creating a backup of a non-existent file"""
+        missing_file = os.path.join(self.test_dir, "does_not_exist.csv")
+        success, message, details = self.backup_mgr.create_backup(missing_file)
+
+        # Check result
+        self.assertFalse(success)
+        self.assertIn("does not exist", message)
+
+    def test_restore_missing_backup(self):
+        """Test restoring from a non-existent backup"""
+        missing_backup = os.path.join(self.backup_dir, "does_not_exist.csv")
+        target_path = os.path.join(self.test_dir, "restored_file.csv")
+
+        success, message, details = self.backup_mgr.restore_from_backup(missing_backup, target_path)
+
+        # Check result
+        self.assertFalse(success)
+        self.assertIn("does not exist", message)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,10 +11,14 @@ import shutil
 import sys
 import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import patch
 
-# Add parent directory to path to import the modules
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+# Path setup for imports
+current_dir = Path(__file__).parent.absolute()
+scripts_dir = current_dir.parent.parent.parent
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
 
 # Import the utility modules
 from Backups.backup_manager import BackupManager, BackupRotation
@@ -30,6 +34,23 @@ from DXF.file_loader import DxfLoader
 from Utils.error_utils import ErrorHandler, ErrorSeverity, ValidationError
 
 
+class _FakeDxfDocument:
+    """Minimal stand-in for an ezdxf document with a fixed modelspace."""
+
+    def __init__(self, entities):
+        """
+        Initialize the fake document.
+
+        Args:
+            entities: List of entities returned by modelspace()
+        """
+        self._modelspace = entities
+
+    def modelspace(self):
+        """Return the modelspace entities, which support iteration and len()."""
+        return self._modelspace
+
+
 class TestErrorHandlingFormat(unittest.TestCase):
     """
     Test that all modules follow the standardized error handling format.
@@ -42,11 +63,11 @@ class TestErrorHandlingFormat(unittest.TestCase):
         """Set up test environment."""
         # Create a temporary directory for testing file operations
         self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
         self.test_file = os.path.join(self.temp_dir, "test_file.txt")
 
         # Create a test file
-        with open(self.test_file, "w") as f:
-            f.write("Test content")
+        Path(self.test_file).write_text("Test content")
 
         # Initialize test objects
         self.gcode_normalizer = GCodeNormalizer()
@@ -56,10 +77,6 @@ class TestErrorHandlingFormat(unittest.TestCase):
         self.dxf_loader = DxfLoader()
         self.drill_extractor = DrillingExtractor()
 
-    def tearDown(self):
-        """Clean up after tests."""
-        shutil.rmtree(self.temp_dir)
-
     def verify_response_format(self, response, expected_success=None):
         """
         Verify that a response follows the standardized format.
@@ -101,8 +118,7 @@ class TestErrorHandlingFormat(unittest.TestCase):
         # Create a mock G-code file content
         gcode_content = "G0 X10 Y10\nG1 Z-5 F100\nG0 Z10"
         gcode_file = os.path.join(self.temp_dir, "test.gcode")
-        with open(gcode_file, "w") as f:
-            f.write(gcode_content)
+        Path(gcode_file).write_text(gcode_content)
 
         # Test preprocess_file success case
         response = self.gcode_preprocessor.preprocess_file(gcode_file)
@@ -173,18 +189,10 @@ class TestErrorHandlingFormat(unittest.TestCase):
         """Test that DxfLoader returns standardized format."""
         # Create a mock DXF file
         dxf_file = os.path.join(self.temp_dir, "test.dxf")
-        with open(dxf_file, "w") as f:
-            f.write("Mock DXF content")
-
-        # Set up mock for ezdxf.readfile
-        mock_doc = MagicMock()
-        # Setup modelspace to return entities
-        mock_modelspace = MagicMock()
-        mock_entities = [MagicMock(), MagicMock()]  # Two mock entities
-        mock_modelspace.__iter__.return_value = mock_entities
-        mock_modelspace.__len__.return_value = len(mock_entities)
-        mock_doc.modelspace.return_value = mock_modelspace
-        mock_readfile.return_value = mock_doc
+        Path(dxf_file).write_text("Mock DXF content")
+
+        # Set up ezdxf.readfile to return a document with two entities
+        mock_readfile.return_value = _FakeDxfDocument([object(), object()])
 
         # Test load_dxf success case
         response = self.dxf_loader.load_dxf(dxf_file)
@@ -210,34 +218,45 @@ class TestErrorHandlingResponses(unittest.TestCase):
         """Set up test environment."""
         # Create a temporary directory for testing
         self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
         self.nonexistent_file = os.path.join(self.temp_dir, "does_not_exist.txt")
 
-    def tearDown(self):
-        """Clean up after tests."""
-        shutil.rmtree(self.temp_dir)
+    def assert_message_contains(self, message, *needles):
+        """
+        Verify that a message contains all of the given lowercase needles.
+
+        Args:
+            message: The response message to check
+            *needles: Lowercase substrings that must all appear in the message
+        """
+        message_lower = message.lower()
+        for needle in needles:
+            self.assertIn(needle, message_lower)
 
     def test_file_not_found_responses(self):
         """Test that file not found errors return appropriate responses."""
-        # Test GCodeNormalizer with non-existent file
-        normalizer = GCodeNormalizer()
-        success, message, details = normalizer.normalize_file(self.nonexistent_file)
+        with self.subTest(module="GCodeNormalizer"):
+            # Test GCodeNormalizer with non-existent file
+            normalizer = GCodeNormalizer()
+            success, message, details = normalizer.normalize_file(self.nonexistent_file)
 
-        # Verify response
-        self.assertFalse(success)
-        self.assertIn("not found", message.lower())
-        self.assertIn("category", details)
-        self.assertEqual(details["category"], "FILE")
+            # Verify response
+            self.assertFalse(success)
+            self.assert_message_contains(message, "not found")
+            self.assertIn("category", details)
+            self.assertEqual(details["category"], "FILE")
 
-        # Test BackupManager with non-existent file
-        backup_dir = os.path.join(self.temp_dir, "backups")
-        backup_manager = BackupManager(backup_dir)
-        success, message, details = backup_manager.create_backup(self.nonexistent_file)
+        with self.subTest(module="BackupManager"):
+            # Test BackupManager with non-existent file
+            backup_dir = os.path.join(self.temp_dir, "backups")
+            backup_manager = BackupManager(backup_dir)
+            success, message, details = backup_manager.create_backup(self.nonexistent_file)
 
-        # Verify response
-        self.assertFalse(success)
-        self.assertIn("does not exist", message.lower())
-        self.assertIn("category", details)
-        self.assertEqual(details["category"], "FILE")
+            # Verify response
+            self.assertFalse(success)
+            self.assert_message_contains(message, "does not exist")
+            self.assertIn("category", details)
+            self.assertEqual(details["category"], "FILE")
 
     def test_validation_error_responses(self):
         """Test that validation errors return appropriate responses."""
@@ -264,7 +283,7 @@ class TestErrorHandlingResponses(unittest.TestCase):
 
             # Verify response
             self.assertFalse(success)
-            self.assertIn("invalid", message.lower())
+            self.assert_message_contains(message, "invalid", "movement")
             self.assertIn("category", details)
             self.assertEqual(details["category"], "VALIDATION")
             self.assertIn("details", details)
@@ -275,8 +294,7 @@ class TestErrorHandlingResponses(unittest.TestCase):
         """Test that success responses include useful information."""
         # Create a test file to use with backup manager
         test_file = os.path.join(self.temp_dir, "test_file.txt")
-        with open(test_file, "w") as f:
-            f.write("Test content")
+        Path(test_file).write_text("Test content")
 
         # Test backup creation (a successful operation)
         backup_dir = os.path.join(self.temp_dir, "backups")
@@ -304,10 +322,7 @@ class TestErrorPropagation(unittest.TestCase):
         """Set up test environment."""
         # Create a temporary directory for testing
         self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up after tests."""
-        shutil.rmtree(self.temp_dir)
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
 
     def test_file_io_error_propagation(self):
         """Test that file I/O errors are properly handled and converted."""
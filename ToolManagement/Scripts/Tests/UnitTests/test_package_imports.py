@@ -7,6 +7,7 @@ pattern that all tests should follow.
 """
 
 import importlib
+import importlib.util
 import os
 import sys
 import unittest
@@ -30,6 +31,15 @@ if str(project_dir) not in sys.path:
 class TestPackageImports(unittest.TestCase):
     """Tests that package imports can be resolved without errors."""
 
+    @staticmethod
+    def _module_exists(module):
+        """Check whether a module can be found by the import system without running it."""
+        try:
+            return importlib.util.find_spec(module) is not None
+        except ModuleNotFoundError:
+            # The parent package is missing
+            return False
+
     def test_dxf_package_import(self):
         """Test that the DXF package can be imported."""
         try:
@@ -73,11 +83,7 @@ class TestPackageImports(unittest.TestCase):
         ]
 
         # Only test modules that actually exist
-        existing_modules = []
-        for module in gcode_modules:
-            module_path = Path(scripts_dir) / f"{module.replace('.', '/')}.py"
-            if module_path.exists():
-                existing_modules.append(module)
+        existing_modules = [module for module in gcode_modules if self._module_exists(module)]
 
         # If no modules exist yet, skip this test
         if not existing_modules:
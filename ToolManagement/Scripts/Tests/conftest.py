@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration for the test suite.
+
+Pytest loads this file before collecting any test module, so the Scripts
+and ToolManagement directories are on the import path before collection.
+The path blocks at the top of each test module stay for direct runs such as
+python test_x.py, where pytest is not involved. run_tests.py adds the same
+paths when the suite is run with unittest.
+"""
+
+import sys
+from pathlib import Path
+
+# Scripts directory (parent of Tests) for package imports like DXF.parser
+scripts_dir = Path(__file__).parent.parent.absolute()
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+# ToolManagement directory for absolute imports
+project_dir = scripts_dir.parent
+if str(project_dir) not in sys.path:
+    sys.path.insert(0, str(project_dir))
@@ -3,18 +3,70 @@ Simple test runner that generates Markdown-friendly output.
 
 This script runs all tests in the UnitTests directory and generates
 a formatted report that can be directly pasted into documentation tools.
+
+Usage:
+    python run_tests.py            # Run the tests and write the report
+    python run_tests.py --verify   # Also check core module imports first
 """
 
 import datetime
+import itertools
 import os
 import sys
 import time
 import unittest
+from collections import defaultdict
 from pathlib import Path
 
 
-def run_tests():
-    """Run all test files from UnitTests directory and return the test result object."""
+def verify_imports():
+    """Print whether ezdxf and the core project modules can be imported."""
+    # Check the core dependency
+    try:
+        import ezdxf
+
+        print(f"Successfully imported ezdxf version {ezdxf.__version__}")
+    except ImportError:
+        print("WARNING: ezdxf module not found. DXF tests may fail.")
+
+    # Verify key modules can be imported
+    print("\nVerifying module imports:")
+    try:
+        import Utils.error_utils
+
+        print("✓ Successfully imported Utils.error_utils")
+    except ImportError as e:
+        print(f"✗ Utils.error_utils import error: {e}")
+
+    try:
+        from Utils.error_utils import ErrorHandler
+
+        print("✓ Successfully imported ErrorHandler from Utils.error_utils")
+    except ImportError as e:
+        print(f"✗ ErrorHandler import error: {e}")
+
+    try:
+        import DXF
+
+        print("✓ Successfully imported DXF package")
+    except ImportError as e:
+        print(f"✗ DXF package import error: {e}")
+
+    try:
+        from DXF.parser import DXFParser
+
+        print("✓ Successfully imported DXFParser from DXF.parser")
+    except ImportError as e:
+        print(f"✗ DXFParser import error: {e}")
+
+
+def run_tests(verify=False):
+    """
+    Run all test files from UnitTests directory and return the test result object.
+
+    Args:
+        verify: If True, print import diagnostics for the core modules before running
+    """
     # Determine the test directory relative to this script
     script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 
@@ -50,14 +102,6 @@ def run_tests():
     print(f"Test directory: {test_dir}")
     print(f"Project directory: {project_dir}")
 
-    # Import core dependencies before running tests
-    try:
-        import ezdxf
-
-        print(f"Successfully imported ezdxf version {ezdxf.__version__}")
-    except ImportError:
-        print("WARNING: ezdxf module not found. DXF tests may fail.")
-
     # Verify key packages exist in the correct locations
     print("\nVerifying package structure:")
     utils_dir = scripts_dir / "Utils"
@@ -73,35 +117,9 @@ def run_tests():
     else:
         print(f"✗ DXF package not found at {dxf_dir}")
 
-    # Verify key modules can be imported
-    print("\nVerifying module imports:")
-    try:
-        import Utils.error_utils
-
-        print("✓ Successfully imported Utils.error_utils")
-    except ImportError as e:
-        print(f"✗ Utils.error_utils import error: {e}")
-
-    try:
-        from Utils.error_utils import ErrorHandler
-
-        print("✓ Successfully imported ErrorHandler from Utils.error_utils")
-    except ImportError as e:
-        print(f"✗ ErrorHandler import error: {e}")
-
-    try:
-        import DXF
-
-        print("✓ Successfully imported DXF package")
-    except ImportError as e:
-        print(f"✗ DXF package import error: {e}")
-
-    try:
-        from DXF.parser import DXFParser
-
-        print("✓ Successfully imported DXFParser from DXF.parser")
-    except ImportError as e:
-        print(f"✗ DXFParser import error: {e}")
+    # Import checks load ezdxf and the packages up front, so only run them on request
+    if verify:
+        verify_imports()
 
     # Find and load all test modules in the UnitTests directory
     # Use the correct start_dir to ensure proper module naming
@@ -129,27 +147,41 @@ def run_tests():
 
     skip_filter = SkipFilter(skip_tests)
 
-    # Find all tests while applying our filter
-    test_suite = unittest.TestSuite()
+    # Test modules are imported by dotted name relative to the Tests directory
+    if str(script_dir) not in sys.path:
+        sys.path.insert(0, str(script_dir))
+
+    # Collect the module and file names of all test files in a single walk
+    test_modules = []
 
     for root, dirs, files in os.walk(str(test_dir)):
-        # Skip directories like __pycache__
-        if os.path.basename(root).startswith("__"):
-            continue
+        # Skip directories like __pycache__ and visit the rest in a stable order
+        dirs[:] = sorted(d for d in dirs if not d.startswith("__"))
 
         # Find test files in this directory
-        for file in files:
+        for file in sorted(files):
             if file.startswith("test_") and file.endswith(".py"):
                 file_path = os.path.join(root, file)
                 # Apply filter
                 if skip_filter(file_path):
-                    # Add tests from this file
-                    rel_path = os.path.relpath(root, str(test_dir))
-                    # Process files in current test directory
-                    sub_suite = unittest.defaultTestLoader.discover(
-                        start_dir=root, pattern=file, top_level_dir=str(script_dir)
-                    )
-                    test_suite.addTest(sub_suite)
+                    rel_path = os.path.relpath(file_path, str(script_dir))
+                    module_name = os.path.splitext(rel_path)[0].replace(os.sep, ".")
+                    test_modules.append((module_name, root, file))
+
+    # Load every module once by name instead of running a discovery pass per file
+    test_suite = unittest.TestSuite()
+
+    for module_name, root, file in test_modules:
+        try:
+            test_suite.addTest(unittest.defaultTestLoader.loadTestsFromName(module_name))
+        except Exception:
+            # loadTestsFromName only reports ImportError as a failed test, so let
+            # discover turn any other import failure into a reported error
+            test_suite.addTest(
+                unittest.defaultTestLoader.discover(
+                    start_dir=root, pattern=file, top_level_dir=str(script_dir)
+                )
+            )
 
     # Run the tests
     start_time = time.time()
@@ -159,28 +191,22 @@ def run_tests():
     return result, run_time
 
 
-def generate_markdown_report(result, run_time):
-    """Generate a report in Markdown format."""
-    now = datetime.datetime.now()
+def generate_markdown_report(result, run_time, now=None):
+    """
+    Generate a report in Markdown format.
 
-    # Count tests by file
-    test_files = {}
+    Args:
+        result: The unittest result object
+        run_time: Test run time in seconds
+        now: Report timestamp, defaults to the current time
+    """
+    now = now or datetime.datetime.now()
 
-    # Process failures
-    for test, _ in result.failures:
-        test_name = test.id().split(".")
-        file_name = test_name[0]
-        if file_name not in test_files:
-            test_files[file_name] = {"total": 0, "failed": 0}
-        test_files[file_name]["total"] += 1
-        test_files[file_name]["failed"] += 1
+    # Count failed and errored tests by file in a single pass
+    test_files = defaultdict(lambda: {"total": 0, "failed": 0})
 
-    # Process errors
-    for test, _ in result.errors:
-        test_name = test.id().split(".")
-        file_name = test_name[0]
-        if file_name not in test_files:
-            test_files[file_name] = {"total": 0, "failed": 0}
+    for test, _ in itertools.chain(result.failures, result.errors):
+        file_name = test.id().partition(".")[0]
         test_files[file_name]["total"] += 1
         test_files[file_name]["failed"] += 1
 
@@ -200,8 +226,9 @@ def generate_markdown_report(result, run_time):
         else:
             test_files["tests"] = {"total": result.testsRun, "failed": 0}
 
-    # Generate report
-    report = f"""
+    # Generate report as a list of parts joined once at the end
+    parts = [
+        f"""
 ### Test Results - {now.strftime("%Y-%m-%d %H:%M")}
 
 #### Summary
@@ -215,44 +242,46 @@ def generate_markdown_report(result, run_time):
 | Time | {run_time:.2f} seconds |
 
 """
+    ]
 
     # Only show the file table if we have test file data
     if test_files:
-        report += "## Results by Test File\n\n"
-        report += "| Test File | Status | Pass/Total |\n"
-        report += "|-----------|--------|------------|\n"
+        parts.append("## Results by Test File\n\n")
+        parts.append("| Test File | Status | Pass/Total |\n")
+        parts.append("|-----------|--------|------------|\n")
 
         for file_name, counts in test_files.items():
             passed = counts["total"] - counts["failed"]
             status = "PASSED" if passed == counts["total"] else "FAILED"
-            report += f"| {file_name} | {status} | {passed}/{counts['total']} |\n"
+            parts.append(f"| {file_name} | {status} | {passed}/{counts['total']} |\n")
 
     if result.failures or result.errors:
-        report += "\n## Failures and Errors\n\n"
+        parts.append("\n## Failures and Errors\n\n")
 
         if result.failures:
-            report += "### Failures\n\n"
+            parts.append("### Failures\n\n")
             for failure in result.failures:
-                report += f"#### {failure[0].id()}\n"
-                report += "```\n"
-                report += str(failure[1])
-                report += "\n```\n\n"
+                parts.append(f"#### {failure[0].id()}\n")
+                parts.append("```\n")
+                parts.append(str(failure[1]))
+                parts.append("\n```\n\n")
 
         if result.errors:
-            report += "### Errors\n\n"
+            parts.append("### Errors\n\n")
             for error in result.errors:
-                report += f"#### {error[0].id()}\n"
-                report += "```\n"
-                report += str(error[1])
-                report += "\n```\n\n"
+                parts.append(f"#### {error[0].id()}\n")
+                parts.append("```\n")
+                parts.append(str(error[1]))
+                parts.append("\n```\n\n")
 
-    return report
+    return "".join(parts)
 
 
-def main():
+def main(verify=False):
     """Run tests and generate report."""
-    result, run_time = run_tests()
-    report = generate_markdown_report(result, run_time)
+    result, run_time = run_tests(verify=verify)
+    now = datetime.datetime.now()
+    report = generate_markdown_report(result, run_time, now)
 
     # Print report to console
     print(report)
@@ -262,9 +291,7 @@ def main():
     log_dir = os.path.join(script_dir, "..", "Logs")
     os.makedirs(log_dir, exist_ok=True)
 
-    report_file = os.path.join(
-        log_dir, f"test_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.txt"
-    )
+    report_file = os.path.join(log_dir, f"test_report_{now.strftime('%Y%m%d_%H%M')}.txt")
 
     with open(report_file, "w") as f:
         f.write(report)
@@ -276,4 +303,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(verify="--verify" in sys.argv[1:]))
@@ -15,22 +15,27 @@ Modules:
     ui_utils: Platform-independent user interface utilities
 """
 
-# Import key classes to make them available at package level
-from .config import AppConfig
-from .error_utils import (
-    BaseError,
-    ConfigurationError,
-    ErrorCategory,
-    ErrorHandler,
-    ErrorSeverity,
-    FileError,
-    ValidationError,
-)
-from .file_loader import BaseFileLoader
-from .file_lock_utils import FileLock
-from .file_utils import FileUtils
-from .logging_utils import get_log_path, log_exception, setup_logger
-from .path_utils import PathUtils
+import importlib
+
+# Submodule that defines each package-level name. The submodules are only
+# imported on first access, so importing one of them does not load the rest.
+_LAZY_IMPORTS = {
+    "AppConfig": "config",
+    "ErrorSeverity": "error_utils",
+    "ErrorCategory": "error_utils",
+    "BaseError": "error_utils",
+    "FileError": "error_utils",
+    "ValidationError": "error_utils",
+    "ConfigurationError": "error_utils",
+    "ErrorHandler": "error_utils",
+    "FileLock": "file_lock_utils",
+    "BaseFileLoader": "file_loader",
+    "FileUtils": "file_utils",
+    "setup_logger": "logging_utils",
+    "log_exception": "logging_utils",
+    "get_log_path": "logging_utils",
+    "PathUtils": "path_utils",
+}
 
 # Define publicly available items
 __all__ = [
@@ -57,3 +62,21 @@ __all__ = [
     # path_utils
     "PathUtils",
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining a package-level name on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -19,9 +19,39 @@ Classes:
 """
 
 import platform
+from functools import cache
 from pathlib import Path
 
 
+@cache
+def _default_mach3_root() -> Path:
+    """
+    Determine the default Mach3 root directory based on the script location.
+
+    Resolved on first use instead of at import, so importing this module does
+    not resolve the file path.
+
+    Returns:
+        Path: The Mach3 root directory
+    """
+    if platform.system() == "Windows":
+        return Path("C:/Mach3")
+
+    # Use script location to determine Mach3 root directory
+    # Start with current file's directory (Utils)
+    current_dir = Path(__file__).resolve().parent
+
+    # If in Utils directory, go up to Scripts then to Mach3 root
+    if current_dir.name.lower() == "utils":
+        scripts_dir = current_dir.parent
+        if scripts_dir.name.lower() == "scripts":
+            return scripts_dir.parent.parent
+        return scripts_dir.parent
+
+    # Fallback to parent of parent
+    return current_dir.parent.parent
+
+
 class PathConfig:
     """Configuration for file system paths."""
 
@@ -43,51 +73,45 @@ class PathConfig:
     TOOL_DATA_FILENAME = "tool-data.csv"
     TOOL_DATA_BACKUP_FILENAME = "tool-data.csv.bak"
 
-    # Default paths based on script location
-    if platform.system() == "Windows":
-        DEFAULT_MACH3_ROOT = Path("C:/Mach3")
-    else:
-        # Use script location to determine Mach3 root directory
-        # Start with current file's directory (Utils)
-        current_dir = Path(__file__).resolve().parent
-
-        # If in Utils directory, go up to Scripts then to Mach3 root
-        if current_dir.name.lower() == "utils":
-            scripts_dir = current_dir.parent
-            if scripts_dir.name.lower() == "scripts":
-                DEFAULT_MACH3_ROOT = scripts_dir.parent.parent
-            else:
-                DEFAULT_MACH3_ROOT = scripts_dir.parent
-        else:
-            # Fallback to parent of parent
-            DEFAULT_MACH3_ROOT = current_dir.parent.parent
+    @classmethod
+    def get_mach3_root(cls) -> Path:
+        """Returns the path to the Mach3 root directory."""
+        return _default_mach3_root()
 
+    # The directory getters below are cached per class, since the paths they
+    # build from the constants above do not change while the process runs
     @classmethod
+    @cache
     def get_tool_management_dir(cls) -> Path:
         """Returns the path to the ToolManagement directory."""
-        return cls.DEFAULT_MACH3_ROOT / cls.TOOL_MANAGEMENT_DIR_NAME
+        return cls.get_mach3_root() / cls.TOOL_MANAGEMENT_DIR_NAME
 
     @classmethod
+    @cache
     def get_data_dir(cls) -> Path:
         """Returns the path to the Data directory."""
         return cls.get_tool_management_dir() / cls.DATA_DIR_NAME
 
     @classmethod
+    @cache
     def get_backups_dir(cls) -> Path:
         """Returns the path to the Backups directory."""
         return cls.get_tool_management_dir() / cls.BACKUPS_DIR_NAME
 
     @classmethod
+    @cache
     def get_logs_dir(cls) -> Path:
         """Returns the path to the Logs directory."""
         return cls.get_tool_management_dir() / cls.LOGS_DIR_NAME
 
     @classmethod
+    @cache
     def get_tool_data_path(cls) -> Path:
         """Returns the path to the tool-data.csv file."""
         return cls.get_data_dir() / cls.TOOL_DATA_FILENAME
 
     @classmethod
+    @cache
     def get_tool_data_backup_path(cls) -> Path:
         """Returns the path to the tool-data.csv.bak file."""
         return cls.get_data_dir() / cls.TOOL_DATA_BACKUP_FILENAME
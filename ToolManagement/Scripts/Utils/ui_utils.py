@@ -11,6 +11,7 @@ Classes:
 import os
 import platform
 import sys
+from itertools import product
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +24,10 @@ except ImportError:
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
     from error_utils import ErrorHandler, ErrorSeverity, FileError
 
+# Every upper/lower case spelling of ".dxf", so file names can be matched
+# case-insensitively without lowercasing each one
+DXF_SUFFIXES = tuple("." + "".join(chars) for chars in product(*zip("dxf", "DXF", strict=True)))
+
 
 class UIUtils:
     """
@@ -78,8 +83,13 @@ class UIUtils:
         Returns:
             Optional[str]: Path to the selected DXF file, or None if no file selected
         """
-        # List DXF files
-        dxf_files = [f for f in os.listdir(dxf_dir) if f.lower().endswith(".dxf")]
+        # List DXF files (scandir entries carry the file type, so no extra stat)
+        with os.scandir(dxf_dir) as entries:
+            dxf_files = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(DXF_SUFFIXES) and entry.is_file()
+            ]
 
         if not dxf_files:
             print("No DXF files found in the specified directory.")
@@ -29,11 +29,8 @@ def check_drill_points(points, stage):
         print(f"Has direction: {has_direction}")
         if has_extrusion:
             print(f"Extrusion vector: {first_point['extrusion_vector']}")
-            # Show all unique extrusion vectors
-            vectors = set()
-            for p in points:
-                if 'extrusion_vector' in p:
-                    vectors.add(p['extrusion_vector'])
+            # Show all unique extrusion vectors (single pass)
+            vectors = {p['extrusion_vector'] for p in points if 'extrusion_vector' in p}
             print(f"Unique extrusion vectors: {sorted(vectors)}")
 
 def main():